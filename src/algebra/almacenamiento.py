@@ -0,0 +1,231 @@
+import mmap
+import os
+import tempfile
+from array import array
+
+DTYPE_TYPECODES = {'float64': 'd', 'float32': 'f'}
+
+def typecodeForDtype(dtype: str) -> str:
+    if dtype not in DTYPE_TYPECODES:
+        raise ValueError(f"Tipo de dato no soportado: {dtype}")
+    return DTYPE_TYPECODES[dtype]
+
+def dtypeForTypecode(typecode: str) -> str:
+    return 'float32' if typecode == 'f' else 'float64'
+
+class DenseStorage:
+    outOfCore = False
+    readOnly = False
+    
+    def __init__(self, rows: int, cols: int, buffer=None, typecode: str = 'd'):
+        self.rows = rows
+        self.cols = cols
+        self.typecode = typecode
+        
+        if buffer is None:
+            self.buffer = array(typecode, [0.0]) * (rows * cols)
+        else:
+            if len(buffer) != rows * cols:
+                raise ValueError("El tamaño del buffer no coincide con las dimensiones")
+            self.buffer = buffer
+            self.readOnly = isinstance(buffer, memoryview) and buffer.readonly
+        
+        self.rowReferences = [1] * rows
+        self.freeRows = []
+    
+    def shareRows(self, physicalRows):
+        for physicalRow in physicalRows:
+            self.rowReferences[physicalRow] += 1
+    
+    def releaseRows(self, physicalRows):
+        for physicalRow in physicalRows:
+            self.rowReferences[physicalRow] -= 1
+            if self.rowReferences[physicalRow] == 0:
+                self.freeRows.append(physicalRow)
+    
+    def isRowShared(self, physicalRow: int) -> bool:
+        return self.rowReferences[physicalRow] > 1
+    
+    def copyRowForWrite(self, physicalRow: int) -> int:
+        values = self.copyRowRange(physicalRow, 1)
+        self.rowReferences[physicalRow] -= 1
+        
+        if self.freeRows:
+            newRow = self.freeRows.pop()
+            self.rowReferences[newRow] = 1
+            self.setRowValues(newRow, values)
+            return newRow
+        return self.appendRow(values)
+    
+    def isCompact(self) -> bool:
+        return len(self.buffer) == self.rows * self.cols and not any(
+            references > 1 for references in self.rowReferences
+        )
+    
+    def detachBuffer(self):
+        detached = array(self.typecode)
+        detached.frombytes(memoryview(self.buffer).cast('B'))
+        self.buffer = detached
+        self.readOnly = False
+    
+    def appendRow(self, values: array) -> int:
+        try:
+            self.buffer.extend(values)
+        except (AttributeError, BufferError):
+            self.detachBuffer()
+            self.buffer.extend(values)
+        self.rowReferences.append(1)
+        self.rows += 1
+        return self.rows - 1
+    
+    def copyRowRange(self, firstRow: int, rowCount: int) -> array:
+        buffer, start = self.rowLocation(firstRow)
+        values = array(self.typecode)
+        values.frombytes(memoryview(buffer[start:start + rowCount * self.cols]).cast('B'))
+        return values
+    
+    def rowLocation(self, physicalRow: int) -> tuple:
+        return self.buffer, physicalRow * self.cols
+    
+    def getValue(self, physicalRow: int, col: int) -> float:
+        buffer, start = self.rowLocation(physicalRow)
+        return buffer[start + col]
+    
+    def setValue(self, physicalRow: int, col: int, value: float):
+        buffer, start = self.rowLocation(physicalRow)
+        buffer[start + col] = value
+    
+    def getRowValues(self, physicalRow: int, startCol: int = 0, endCol: int = None) -> array:
+        buffer, start = self.rowLocation(physicalRow)
+        end = start + (self.cols if endCol is None else endCol)
+        return buffer[start + startCol:end]
+    
+    def setRowValues(self, physicalRow: int, values, startCol: int = 0):
+        buffer, start = self.rowLocation(physicalRow)
+        start += startCol
+        buffer[start:start + len(values)] = values
+    
+    def scaleRow(self, physicalRow: int, scalar: float, startCol: int = 0):
+        buffer, start = self.rowLocation(physicalRow)
+        segment = buffer[start + startCol:start + self.cols]
+        buffer[start + startCol:start + self.cols] = array(self.typecode, [value * scalar for value in segment])
+    
+    def addScaledRow(self, sourceRow: int, targetRow: int, scalar: float, startCol: int = 0, endCol: int = None):
+        sourceBuffer, sourceStart = self.rowLocation(sourceRow)
+        targetBuffer, targetStart = self.rowLocation(targetRow)
+        sourceStart += startCol
+        targetStart += startCol
+        length = (self.cols if endCol is None else endCol) - startCol
+        source = sourceBuffer[sourceStart:sourceStart + length]
+        target = targetBuffer[targetStart:targetStart + length]
+        targetBuffer[targetStart:targetStart + length] = array(
+            self.typecode, [targetValue + scalar * sourceValue for sourceValue, targetValue in zip(source, target)]
+        )
+
+
+class MappedStorage(DenseStorage):
+    outOfCore = True
+    
+    def __init__(self, rows: int, cols: int, filePath: str, create: bool = True, typecode: str = 'd'):
+        self.filePath = filePath
+        self.fileRows = rows
+        self.scratchFile = None
+        self.scratchRegion = None
+        self.scratchBuffer = None
+        self.scratchCapacity = 0
+        byteSize = rows * cols * array(typecode).itemsize
+        
+        if create:
+            self.backingFile = open(filePath, 'w+b')
+            self.backingFile.truncate(byteSize)
+        else:
+            if os.path.getsize(filePath) != byteSize:
+                raise ValueError("El tamaño del archivo no coincide con las dimensiones")
+            self.backingFile = open(filePath, 'r+b')
+        
+        if byteSize > 0:
+            self.mappedRegion = mmap.mmap(self.backingFile.fileno(), byteSize)
+            super().__init__(rows, cols, memoryview(self.mappedRegion).cast(typecode), typecode)
+        else:
+            self.mappedRegion = None
+            super().__init__(rows, cols, typecode=typecode)
+    
+    def releaseRows(self, physicalRows):
+        if not self.backingFile.closed:
+            super().releaseRows(physicalRows)
+    
+    def rowLocation(self, physicalRow: int) -> tuple:
+        if physicalRow < self.fileRows or not self.cols:
+            return self.buffer, physicalRow * self.cols
+        return self.scratchBuffer, (physicalRow - self.fileRows) * self.cols
+    
+    def isCompact(self) -> bool:
+        return self.rows == self.fileRows and not any(references > 1 for references in self.rowReferences)
+    
+    def appendRow(self, values: array) -> int:
+        if self.cols and self.rows - self.fileRows == self.scratchCapacity:
+            self.growScratch(max(self.fileRows // 8, 2 * self.scratchCapacity, 1))
+        self.rowReferences.append(1)
+        self.rows += 1
+        self.setRowValues(self.rows - 1, values)
+        return self.rows - 1
+    
+    def growScratch(self, capacity: int):
+        byteSize = capacity * self.cols * array(self.typecode).itemsize
+        if self.scratchFile is None:
+            self.scratchFile = tempfile.TemporaryFile(dir=os.path.dirname(os.path.abspath(self.filePath)))
+            self.scratchFile.truncate(byteSize)
+            self.scratchRegion = mmap.mmap(self.scratchFile.fileno(), byteSize)
+        else:
+            self.scratchBuffer.release()
+            self.scratchFile.truncate(byteSize)
+            self.scratchRegion.resize(byteSize)
+        self.scratchBuffer = memoryview(self.scratchRegion).cast(self.typecode)
+        self.scratchCapacity = capacity
+    
+    def storeRows(self, rowOrder: list):
+        pending = {target: source for target, source in enumerate(rowOrder) if source != target}
+        neededSources = set(pending.values())
+        for start in list(pending):
+            if start in pending and start not in neededSources:
+                self.moveRowChain(start, pending)
+        for start in list(pending):
+            if start in pending:
+                self.moveRowChain(start, pending, self.copyRowRange(start, 1))
+        
+        self.releaseScratch()
+        self.rows = self.fileRows
+        self.rowReferences = [1] * self.fileRows
+        self.freeRows = []
+    
+    def moveRowChain(self, target: int, pending: dict, savedRow: array = None):
+        start = target
+        while target in pending:
+            source = pending.pop(target)
+            if source == start:
+                self.setRowValues(target, savedRow)
+                return
+            self.setRowValues(target, self.copyRowRange(source, 1))
+            target = source
+    
+    def releaseScratch(self):
+        if self.scratchFile is None:
+            return
+        self.scratchBuffer.release()
+        self.scratchRegion.close()
+        self.scratchFile.close()
+        self.scratchFile = self.scratchRegion = self.scratchBuffer = None
+        self.scratchCapacity = 0
+    
+    def flush(self):
+        if self.mappedRegion is not None:
+            self.mappedRegion.flush()
+    
+    def close(self):
+        self.releaseScratch()
+        if isinstance(self.buffer, memoryview):
+            self.buffer.release()
+        if self.mappedRegion is not None:
+            self.mappedRegion.close()
+            self.mappedRegion = None
+        self.backingFile.close()
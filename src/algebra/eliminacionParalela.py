@@ -0,0 +1,102 @@
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import os
+from algebra.matrix import Matrix
+from errores.tiposErrores import MatrixDimensionsError, SingularMatrixError
+
+shared_block = None
+shared_view = None
+
+def attach_shared_matrix(block_name: str):
+    global shared_block, shared_view
+    shared_block = shared_memory.SharedMemory(name=block_name)
+    shared_view = shared_block.buf.cast('d')
+
+def eliminate_rows(values, cols: int, pivot: int, row_start: int, row_end: int):
+    pivot_start = pivot * cols + pivot
+    pivot_segment = values[pivot_start:(pivot + 1) * cols].tolist()
+    pivot_val = pivot_segment[0]
+    
+    for row in range(row_start, row_end):
+        target_start = row * cols + pivot
+        factor = values[target_start] / pivot_val
+        if factor == 0.0:
+            continue
+        target_end = (row + 1) * cols
+        values[target_start:target_end] = array('d', [
+            value - factor * source
+            for value, source in zip(values[target_start:target_end].tolist(), pivot_segment)
+        ])
+
+def eliminate_shared_rows(cols: int, pivot: int, row_start: int, row_end: int):
+    eliminate_rows(shared_view, cols, pivot, row_start, row_end)
+
+class ParallelEliminator:
+    PIVOTING_STRATEGIES = ('partial', 'scaled')
+    
+    def __init__(self, workers: int = None, min_rows_per_task: int = 32):
+        if min_rows_per_task <= 0:
+            raise ValueError("El numero minimo de filas por tarea debe ser positivo")
+        self.workers = workers or os.cpu_count() or 1
+        self.min_rows_per_task = min_rows_per_task
+    
+    def eliminate(self, aug_matrix: Matrix, pivoting: str = 'partial') -> Matrix:
+        if pivoting not in self.PIVOTING_STRATEGIES:
+            raise ValueError(f"Estrategia de pivoteo no soportada en eliminacion paralela: {pivoting}")
+        if aug_matrix.cols <= aug_matrix.rows:
+            raise MatrixDimensionsError("Matriz aumentada debe tener n x (n+k) con k >= 1")
+        
+        n = aug_matrix.rows
+        cols = aug_matrix.cols
+        source = aug_matrix.logical_buffer()
+        if source.typecode != 'd':
+            source = array('d', source)
+        byte_size = len(source) * source.itemsize
+        block = shared_memory.SharedMemory(create=True, size=max(1, byte_size))
+        values = block.buf.cast('d')
+        try:
+            values[:len(source)] = source
+            if self.workers > 1:
+                with ProcessPoolExecutor(max_workers=self.workers, initializer=attach_shared_matrix,
+                                         initargs=(block.name,)) as executor:
+                    self.eliminate_pivots(values, n, cols, pivoting, executor)
+            else:
+                self.eliminate_pivots(values, n, cols, pivoting, None)
+            return Matrix.from_buffer(n, cols, array(aug_matrix.storage.typecode, values[:len(source)]))
+        finally:
+            values.release()
+            block.close()
+            block.unlink()
+    
+    def eliminate_pivots(self, values, n: int, cols: int, pivoting: str, executor: ProcessPoolExecutor):
+        if pivoting == 'scaled':
+            scale_factors = [max((abs(value) for value in values[row * cols:row * cols + n]), default=0.0) or 1.0
+                             for row in range(n)]
+        else:
+            scale_factors = [1.0] * n
+        
+        for pivot in range(n):
+            max_row = max(range(pivot, n), key=lambda row: abs(values[row * cols + pivot]) / scale_factors[row])
+            if max_row != pivot:
+                pivot_row = values[pivot * cols:(pivot + 1) * cols].tobytes()
+                values[pivot * cols:(pivot + 1) * cols] = values[max_row * cols:(max_row + 1) * cols]
+                values[max_row * cols:(max_row + 1) * cols] = memoryview(pivot_row).cast('d')
+                scale_factors[pivot], scale_factors[max_row] = scale_factors[max_row], scale_factors[pivot]
+            
+            if abs(values[pivot * cols + pivot]) < 1e-10:
+                raise SingularMatrixError("Matriz singular o mal condicionada")
+            
+            remaining = n - pivot - 1
+            task_count = min(self.workers, remaining // self.min_rows_per_task)
+            if executor is None or task_count <= 1:
+                eliminate_rows(values, cols, pivot, pivot + 1, n)
+                continue
+            
+            band_size = -(-remaining // task_count)
+            pending = [
+                executor.submit(eliminate_shared_rows, cols, pivot, row_start, min(row_start + band_size, n))
+                for row_start in range(pivot + 1, n, band_size)
+            ]
+            for future in pending:
+                future.result()
@@ -0,0 +1,58 @@
+from algebra.matrix import Matrix
+
+class MatrixStructure:
+    def __init__(self, kind: str, lower_bandwidth: int, upper_bandwidth: int, symmetric: bool = False):
+        self.kind = kind
+        self.lower_bandwidth = lower_bandwidth
+        self.upper_bandwidth = upper_bandwidth
+        self.symmetric = symmetric
+    
+    def is_banded(self) -> bool:
+        return self.kind in ('diagonal', 'tridiagonal', 'banded')
+    
+    def __str__(self):
+        symmetry = ", simetrica" if self.symmetric else ""
+        return f"{self.kind} (ancho inferior {self.lower_bandwidth}, superior {self.upper_bandwidth}{symmetry})"
+
+def detect_bandwidth(matrix: Matrix, size: int = None) -> tuple:
+    size = min(matrix.rows, matrix.cols) if size is None else size
+    lower_bandwidth = 0
+    upper_bandwidth = 0
+    
+    for i in range(matrix.rows):
+        row = matrix.get_row(i)[:size] if matrix.cols else []
+        first_col = next((j for j, value in enumerate(row) if value != 0.0), None)
+        if first_col is None:
+            continue
+        last_col = next(j for j in range(len(row) - 1, -1, -1) if row[j] != 0.0)
+        lower_bandwidth = max(lower_bandwidth, i - first_col)
+        upper_bandwidth = max(upper_bandwidth, last_col - i)
+    
+    return lower_bandwidth, upper_bandwidth
+
+def is_symmetric(matrix: Matrix, size: int = None, tolerance: float = 1e-12) -> bool:
+    size = min(matrix.rows, matrix.cols) if size is None else size
+    for i in range(size):
+        row = matrix.get_row(i)
+        for j in range(i + 1, size):
+            upper = row[j]
+            lower = matrix.get(j, i)
+            if abs(upper - lower) > tolerance * max(1.0, abs(upper), abs(lower)):
+                return False
+    return True
+
+def detect_structure(matrix: Matrix, max_band_fraction: float = 0.25) -> MatrixStructure:
+    size = min(matrix.rows, matrix.cols)
+    lower_bandwidth, upper_bandwidth = detect_bandwidth(matrix, size)
+    
+    if lower_bandwidth == 0 and upper_bandwidth == 0:
+        kind = 'diagonal'
+    elif lower_bandwidth <= 1 and upper_bandwidth <= 1:
+        kind = 'tridiagonal'
+    elif lower_bandwidth + upper_bandwidth + 1 <= max_band_fraction * size:
+        kind = 'banded'
+    else:
+        kind = 'dense'
+    
+    symmetric = lower_bandwidth == upper_bandwidth and is_symmetric(matrix, size)
+    return MatrixStructure(kind, lower_bandwidth, upper_bandwidth, symmetric)
@@ -0,0 +1,377 @@
+import math
+import sys
+from array import array
+from operator import mul
+from errores.tiposErrores import MatrixDimensionsError, SingularMatrixError, NonPositiveDefiniteError
+from estructuras.listaEnlazada import LinkedList
+
+FLOAT32_EPSILON = 2.0 ** -23
+
+def row_maximum(matrix: 'Matrix', row: int, start_col: int, end_col: int) -> tuple:
+    if start_col >= end_col:
+        return (0.0, start_col)
+    magnitudes = list(map(abs, matrix.get_row(row, start_col)[:end_col - start_col]))
+    max_val = max(magnitudes)
+    return (max_val, start_col + magnitudes.index(max_val))
+
+def matrix_norm_one(matrix: 'Matrix', size: int) -> float:
+    column_sums = [0.0] * size
+    for row in range(size):
+        column_sums = [total + abs(value) for total, value in zip(column_sums, matrix.get_row(row)[:size])]
+    return max(column_sums, default=0.0)
+
+def compute_scale_factors(matrix: 'Matrix', end_col: int) -> list:
+    scale_factors = []
+    for row in range(matrix.rows):
+        max_in_row = max(map(abs, matrix.get_row(row)[:end_col]), default=0.0)
+        scale_factors.append(max_in_row if max_in_row > 0 else 1.0)
+    return scale_factors
+
+def permutation_sign(permutation: list) -> float:
+    sign = 1.0
+    visited = [False] * len(permutation)
+    for start in range(len(permutation)):
+        if visited[start]:
+            continue
+        position = start
+        cycle_length = 0
+        while not visited[position]:
+            visited[position] = True
+            position = permutation[position]
+            cycle_length += 1
+        if cycle_length % 2 == 0:
+            sign = -sign
+    return sign
+
+def complete_pivoting(matrix: 'Matrix', pivot: int, row_maxima: list = None) -> int:
+    n = matrix.rows
+    if row_maxima is None:
+        row_maxima = [None] * pivot + [row_maximum(matrix, row, pivot, n) for row in range(pivot, n)]
+    
+    max_row = max(range(pivot, n), key=lambda row: row_maxima[row][0])
+    max_col = row_maxima[max_row][1]
+    
+    if max_row != pivot:
+        matrix.swap_rows(pivot, max_row)
+        row_maxima[pivot], row_maxima[max_row] = row_maxima[max_row], row_maxima[pivot]
+    
+    if max_col != pivot:
+        matrix.swap_columns(pivot, max_col)
+        for row in range(pivot, n):
+            max_val, col = row_maxima[row]
+            if col == pivot:
+                row_maxima[row] = (max_val, max_col)
+            elif col == max_col:
+                row_maxima[row] = (max_val, pivot)
+    
+    return max_col
+
+class LUFactorization:
+    PIVOTING_STRATEGIES = ('partial', 'scaled', 'complete')
+    
+    def __init__(self, matrix: 'Matrix', pivoting: str = 'partial', typecode: str = None):
+        if pivoting not in self.PIVOTING_STRATEGIES:
+            raise ValueError(f"Estrategia de pivoteo no soportada: {pivoting}")
+        if matrix.cols < matrix.rows:
+            raise MatrixDimensionsError("La matriz debe tener al menos n columnas para factorizar")
+        
+        self.size = matrix.rows
+        self.pivoting = pivoting
+        self.typecode = typecode = typecode or matrix.storage.typecode
+        self.source_version = matrix.version
+        self.norm_one = matrix_norm_one(matrix, self.size)
+        self.condition_estimate = None
+        
+        width = matrix.cols if pivoting == 'complete' else self.size
+        coefficients = array(typecode)
+        for i in range(self.size):
+            coefficients.extend(array(typecode, matrix.get_row(i, 0, width)))
+        self.lu = type(matrix).from_buffer(self.size, width, coefficients)
+        self.col_permutation = list(range(width))
+        self.rank = self.coefficient_rank = self.size
+        
+        self.factor()
+        self.row_permutation = list(self.lu.row_order)
+    
+    @staticmethod
+    def for_matrix(matrix: 'Matrix', pivoting: str = 'partial', typecode: str = None) -> 'LUFactorization':
+        typecode = typecode or matrix.storage.typecode
+        cache_key = pivoting if typecode == 'd' else f"{pivoting}_{typecode}"
+        matrix.sync_writable_exports()
+        cached = matrix.factorization_cache.get(cache_key)
+        if cached is not None and cached.source_version == matrix.version:
+            return cached
+        
+        factorization = LUFactorization(matrix, pivoting, typecode)
+        matrix.factorization_cache[cache_key] = factorization
+        return factorization
+    
+    def rank_tolerance(self) -> float:
+        width = self.lu.cols
+        largest = max((row_maximum(self.lu, row, 0, width)[0] for row in range(self.size)), default=0.0)
+        epsilon = FLOAT32_EPSILON if self.typecode == 'f' else sys.float_info.epsilon
+        return max(self.size, width) * epsilon * largest
+    
+    def factor(self):
+        n = self.size
+        lu = self.lu
+        scale_factors = None
+        row_maxima = None
+        search_end = n
+        if self.pivoting == 'scaled':
+            scale_factors = compute_scale_factors(lu, n)
+        elif self.pivoting == 'complete':
+            tolerance = self.rank_tolerance()
+            row_maxima = [row_maximum(lu, row, 0, n) for row in range(n)]
+        
+        for pivot in range(n):
+            if self.pivoting == 'complete':
+                largest = max(row_maxima[row][0] for row in range(pivot, n))
+                if largest <= tolerance and search_end < lu.cols:
+                    self.coefficient_rank = pivot
+                    search_end = lu.cols
+                    for row in range(pivot, n):
+                        row_maxima[row] = row_maximum(lu, row, pivot, search_end)
+                    largest = max(row_maxima[row][0] for row in range(pivot, n))
+                if largest <= tolerance:
+                    self.rank = pivot
+                    self.coefficient_rank = min(self.coefficient_rank, pivot)
+                    return
+                
+                max_col = complete_pivoting(lu, pivot, row_maxima)
+                self.col_permutation[pivot], self.col_permutation[max_col] = \
+                    self.col_permutation[max_col], self.col_permutation[pivot]
+                max_row = pivot
+            elif self.pivoting == 'scaled':
+                max_row = max(range(pivot, n),
+                              key=lambda row: abs(lu.get(row, pivot)) / scale_factors[row])
+            else:
+                max_row = max(range(pivot, n), key=lambda row: abs(lu.get(row, pivot)))
+            
+            if max_row != pivot:
+                lu.swap_rows(pivot, max_row)
+                if scale_factors is not None:
+                    scale_factors[pivot], scale_factors[max_row] = scale_factors[max_row], scale_factors[pivot]
+            
+            pivot_val = lu.get(pivot, pivot)
+            if row_maxima is None and abs(pivot_val) < 1e-10:
+                raise SingularMatrixError("Matriz singular o mal condicionada")
+            
+            for row in range(pivot + 1, n):
+                factor = lu.get(row, pivot) / pivot_val
+                if factor != 0.0 and pivot + 1 < lu.cols:
+                    lu.add_row(pivot, row, -factor, start_col=pivot + 1)
+                lu.set(row, pivot, factor)
+                if row_maxima is not None and (factor != 0.0 or row_maxima[row][1] <= pivot):
+                    row_maxima[row] = row_maximum(lu, row, pivot + 1, search_end)
+    
+    def check_nonsingular(self):
+        if self.coefficient_rank < self.size:
+            raise SingularMatrixError("Matriz singular o mal condicionada")
+    
+    def solve(self, constants: list) -> list:
+        return self.solve_columns([constants])[0]
+    
+    def solve_columns(self, constant_columns: list) -> list:
+        self.check_nonsingular()
+        n = self.size
+        for constants in constant_columns:
+            if len(constants) != n:
+                raise MatrixDimensionsError("Número de constantes no coincide con filas")
+        
+        partials = [[constants[original_row] for original_row in self.row_permutation]
+                    for constants in constant_columns]
+        for i in range(1, n):
+            row = self.lu.get_row(i)[:i]
+            for partial in partials:
+                partial[i] -= sum(map(mul, row, partial[:i]))
+        
+        reduced_columns = [[0.0] * n for _ in constant_columns]
+        for i in range(n - 1, -1, -1):
+            row = self.lu.get_row(i, i, n)
+            upper = row[1:]
+            for partial, reduced in zip(partials, reduced_columns):
+                reduced[i] = (partial[i] - sum(map(mul, upper, reduced[i + 1:]))) / row[0]
+        
+        solutions = []
+        for reduced in reduced_columns:
+            values = [0.0] * n
+            for position, original_col in enumerate(self.col_permutation[:n]):
+                values[original_col] = reduced[position]
+            solutions.append(values)
+        return solutions
+    
+    def solve_transpose(self, constants: list) -> list:
+        self.check_nonsingular()
+        n = self.size
+        if len(constants) != n:
+            raise MatrixDimensionsError("Número de constantes no coincide con filas")
+        
+        partial = [constants[original_col] for original_col in self.col_permutation[:n]]
+        for i in range(n):
+            row = self.lu.get_row(i, i, n)
+            partial[i] /= row[0]
+            value = partial[i]
+            for offset, upper in enumerate(row[1:], i + 1):
+                partial[offset] -= upper * value
+        
+        for i in range(n - 1, 0, -1):
+            value = partial[i]
+            for k, lower in enumerate(self.lu.get_row(i)[:i]):
+                partial[k] -= lower * value
+        
+        values = [0.0] * n
+        for position, original_row in enumerate(self.row_permutation):
+            values[original_row] = partial[position]
+        return values
+    
+    def estimate_inverse_norm(self, max_iterations: int = 5) -> float:
+        n = self.size
+        if n == 0:
+            return 0.0
+        
+        probe = [1.0 / n] * n
+        estimate = 0.0
+        previous_index = None
+        for _ in range(max_iterations):
+            image = self.solve(probe)
+            estimate = sum(map(abs, image))
+            signs = [1.0 if value >= 0.0 else -1.0 for value in image]
+            gradient = self.solve_transpose(signs)
+            index = max(range(n), key=lambda k: abs(gradient[k]))
+            if abs(gradient[index]) <= sum(map(mul, gradient, probe)) or index == previous_index:
+                break
+            probe = [0.0] * n
+            probe[index] = 1.0
+            previous_index = index
+        
+        alternating = [(-1.0) ** i * (1.0 + i / (n - 1)) if n > 1 else 1.0 for i in range(n)]
+        alternating_estimate = 2.0 * sum(map(abs, self.solve(alternating))) / (3.0 * n)
+        return max(estimate, alternating_estimate)
+    
+    def estimate_condition(self) -> float:
+        if self.condition_estimate is None:
+            self.condition_estimate = self.norm_one * self.estimate_inverse_norm()
+        return self.condition_estimate
+    
+    def solve_augmented(self, aug_matrix: 'Matrix') -> LinkedList:
+        if aug_matrix.rows != self.size or aug_matrix.cols != self.size + 1:
+            raise MatrixDimensionsError("Matriz aumentada debe tener n x (n+1)")
+        
+        solution = LinkedList()
+        for value in self.solve([aug_matrix.get(i, self.size) for i in range(self.size)]):
+            solution.addElementAtEnd(value)
+        return solution
+    
+    def solve_right_hand_sides(self, aug_matrix: 'Matrix') -> 'Matrix':
+        if aug_matrix.rows != self.size or aug_matrix.cols <= self.size:
+            raise MatrixDimensionsError("Matriz aumentada debe tener n x (n+k) con k >= 1")
+        
+        rhs_count = aug_matrix.cols - self.size
+        constant_columns = [[] for _ in range(rhs_count)]
+        for i in range(self.size):
+            for column, value in zip(constant_columns, aug_matrix.get_row(i, self.size)):
+                column.append(value)
+        
+        solutions = self.solve_columns(constant_columns)
+        values = array(self.typecode)
+        for i in range(self.size):
+            values.extend(solution[i] for solution in solutions)
+        return type(self.lu).from_buffer(self.size, rhs_count, values)
+    
+    def determinant(self) -> float:
+        if self.coefficient_rank < self.size:
+            return 0.0
+        result = permutation_sign(self.row_permutation) * permutation_sign(self.col_permutation)
+        for i in range(self.size):
+            result *= self.lu.get(i, i)
+        return result
+    
+    def inverse(self) -> 'Matrix':
+        n = self.size
+        solutions = self.solve_columns([[1.0 if row == col else 0.0 for row in range(n)] for col in range(n)])
+        values = array(self.typecode)
+        for i in range(n):
+            values.extend(solution[i] for solution in solutions)
+        return type(self.lu).from_buffer(n, n, values)
+    
+    def __str__(self):
+        precision = " (float32)" if self.typecode == 'f' else ""
+        return f"LU pivoteo {self.pivoting}{precision}"
+
+class CholeskyFactorization(LUFactorization):
+    def __init__(self, matrix: 'Matrix'):
+        if matrix.cols < matrix.rows:
+            raise MatrixDimensionsError("La matriz debe tener al menos n columnas para factorizar")
+        
+        self.size = matrix.rows
+        self.pivoting = 'cholesky'
+        self.typecode = matrix.storage.typecode
+        self.source_version = matrix.version
+        self.norm_one = matrix_norm_one(matrix, self.size)
+        self.condition_estimate = None
+        self.row_permutation = list(range(self.size))
+        self.col_permutation = list(range(self.size))
+        self.rank = self.coefficient_rank = self.size
+        self.lu = self.factor_lower(matrix)
+    
+    @staticmethod
+    def for_matrix(matrix: 'Matrix') -> 'CholeskyFactorization':
+        matrix.sync_writable_exports()
+        cached = matrix.factorization_cache.get('cholesky')
+        if cached is not None and cached.source_version == matrix.version:
+            return cached
+        
+        factorization = CholeskyFactorization(matrix)
+        matrix.factorization_cache['cholesky'] = factorization
+        return factorization
+    
+    def factor_lower(self, matrix: 'Matrix') -> 'Matrix':
+        n = self.size
+        lower_rows = []
+        for i in range(n):
+            row = matrix.get_row(i)
+            lower_row = []
+            for j in range(i):
+                lower_row.append((row[j] - sum(map(mul, lower_row, lower_rows[j][:j]))) / lower_rows[j][j])
+            diagonal = row[i] - sum(map(mul, lower_row, lower_row))
+            if diagonal <= 0.0:
+                raise NonPositiveDefiniteError("Pivote no positivo en la factorizacion de Cholesky")
+            lower_row.append(math.sqrt(diagonal))
+            lower_rows.append(lower_row)
+        
+        values = array(self.typecode, [0.0]) * (n * n)
+        for i, lower_row in enumerate(lower_rows):
+            values[i * n:i * n + i + 1] = array(self.typecode, lower_row)
+        return type(matrix).from_buffer(n, n, values)
+    
+    def solve_columns(self, constant_columns: list) -> list:
+        n = self.size
+        for constants in constant_columns:
+            if len(constants) != n:
+                raise MatrixDimensionsError("Número de constantes no coincide con filas")
+        
+        partials = [list(constants) for constants in constant_columns]
+        for i in range(n):
+            row = self.lu.get_row(i)[:i + 1]
+            for partial in partials:
+                partial[i] = (partial[i] - sum(map(mul, row[:i], partial[:i]))) / row[i]
+        
+        solutions = [[0.0] * n for _ in constant_columns]
+        for i in range(n - 1, -1, -1):
+            row = self.lu.get_row(i)[:i + 1]
+            for partial, solution in zip(partials, solutions):
+                value = partial[i] / row[i]
+                solution[i] = value
+                for k in range(i):
+                    partial[k] -= row[k] * value
+        return solutions
+    
+    def solve_transpose(self, constants: list) -> list:
+        return self.solve(constants)
+    
+    def determinant(self) -> float:
+        return math.prod(self.lu.get(i, i) for i in range(self.size)) ** 2
+    
+    def __str__(self):
+        return "Cholesky"
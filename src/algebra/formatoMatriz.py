@@ -0,0 +1,51 @@
+import io
+
+class MatrixFormatter:
+    ELLIPSIS = "..."
+    
+    def __init__(self, precision: int = 4, max_rows: int = 40, max_cols: int = 20, edge_items: int = 3):
+        if precision < 0:
+            raise ValueError("La precision debe ser no negativa")
+        if edge_items <= 0:
+            raise ValueError("El numero de elementos por extremo debe ser positivo")
+        self.precision = precision
+        self.max_rows = max_rows
+        self.max_cols = max_cols
+        self.edge_items = edge_items
+        self.format_value = f"{{:.{precision}f}}".format
+    
+    def is_summarized(self, matrix) -> bool:
+        return matrix.rows > self.max_rows or matrix.cols > self.max_cols
+    
+    def format_values(self, values) -> str:
+        return " ".join(map(self.format_value, values))
+    
+    def format_row(self, matrix, i: int, summarize_cols: bool) -> str:
+        if not summarize_cols:
+            return self.format_values(matrix.get_row(i))
+        head = matrix.get_row(i, 0, self.edge_items)
+        tail = matrix.get_row(i, matrix.cols - self.edge_items)
+        return f"{self.format_values(head)} {self.ELLIPSIS} {self.format_values(tail)}"
+    
+    def write(self, matrix, stream):
+        if matrix.cols == 0:
+            stream.write("\n" * max(matrix.rows - 1, 0))
+            return
+        
+        summarize_rows = matrix.rows > self.max_rows and matrix.rows > 2 * self.edge_items
+        summarize_cols = matrix.cols > self.max_cols and matrix.cols > 2 * self.edge_items
+        if summarize_rows:
+            row_indices = list(range(self.edge_items)) + [None] + \
+                list(range(matrix.rows - self.edge_items, matrix.rows))
+        else:
+            row_indices = range(matrix.rows)
+        
+        for position, i in enumerate(row_indices):
+            if position:
+                stream.write("\n")
+            stream.write(self.ELLIPSIS if i is None else self.format_row(matrix, i, summarize_cols))
+    
+    def to_string(self, matrix) -> str:
+        stream = io.StringIO()
+        self.write(matrix, stream)
+        return stream.getvalue()
@@ -1,60 +1,202 @@
+import weakref
+from array import array
+from operator import add
 from estructuras.listaEnlazada import LinkedList
+from algebra.almacenamiento import DenseStorage, MappedStorage, typecodeForDtype, dtypeForTypecode
+from algebra.multiplicacion import MatrixMultiplier
+from algebra.factorizacionLU import LUFactorization
+from algebra.formatoMatriz import MatrixFormatter
+from algebra.vistaMatriz import MatrixView
 from errores.tiposErrores import MatrixDimensionsError, SingularMatrixError
 
 class Matrix:
-    def __init__(self, rows: int, cols: int, data: LinkedList = None):
+    def __init__(self, rows: int, cols: int, data: LinkedList = None, storage: DenseStorage = None,
+                 dtype: str = 'float64'):
         self.rows = rows
         self.cols = cols
+        self.storage = storage if storage is not None else DenseStorage(rows, cols, typecode=typecodeForDtype(dtype))
+        self.row_order = list(range(rows))
+        self.row_release = weakref.finalize(self, self.storage.releaseRows, self.row_order)
+        self.version = 0
+        self.factorization_cache = {}
+        self.structure = None
+        self.writable_exports = []
         
-        if data is None:
-            self.data = LinkedList()
-            for _ in range(rows):
-                row = LinkedList()
-                for _ in range(cols):
-                    row.addElementAtEnd(0.0)
-                self.data.addElementAtEnd(row)
-        else:
-            self.data = data
+        if data is not None:
+            self.load_rows(data)
+    
+    def mark_modified(self):
+        self.version += 1
+        self.factorization_cache.clear()
+        self._structure = None
+    
+    def sync_writable_exports(self):
+        live_exports = []
+        for reference in self.writable_exports:
+            view = reference()
+            if view is None:
+                continue
+            try:
+                view.nbytes
+            except ValueError:
+                continue
+            live_exports.append(reference)
+        self.writable_exports = live_exports
+        if live_exports:
+            self.mark_modified()
+    
+    @property
+    def structure(self):
+        self.sync_writable_exports()
+        return self._structure
+    
+    @structure.setter
+    def structure(self, value):
+        self._structure = value
+    
+    def snapshot(self) -> 'Matrix':
+        copy = Matrix.__new__(Matrix)
+        copy.rows = self.rows
+        copy.cols = self.cols
+        copy.storage = self.storage
+        copy.row_order = list(self.row_order)
+        copy.version = 0
+        copy.factorization_cache = {}
+        copy.structure = self.structure
+        copy.writable_exports = self.writable_exports
+        self.storage.shareRows(copy.row_order)
+        copy.row_release = weakref.finalize(copy, copy.storage.releaseRows, copy.row_order)
+        return copy
+    
+    def writable_row(self, i: int) -> int:
+        if self.storage.readOnly:
+            self.storage.detachBuffer()
+        physical_row = self.row_order[i]
+        if self.storage.isRowShared(physical_row):
+            physical_row = self.storage.copyRowForWrite(physical_row)
+            self.row_order[i] = physical_row
+        return physical_row
+    
+    def load_rows(self, data):
+        self.mark_modified()
+        for i, row in enumerate(data):
+            if i >= self.rows:
+                break
+            for j, value in enumerate(row):
+                if j >= self.cols:
+                    break
+                self.storage.setValue(self.writable_row(i), j, value)
+    
+    def check_index(self, i: int, j: int):
+        if i < 0 or i >= self.rows or j < 0 or j >= self.cols:
+            raise IndexError("Indice fuera de rango")
     
     def get(self, i: int, j: int) -> float:
-        row = self.data.getElementAtIndex(i)
-        return row.getElementAtIndex(j)
+        self.check_index(i, j)
+        return self.storage.getValue(self.row_order[i], j)
     
     def set(self, i: int, j: int, value: float):
-        row = self.data.getElementAtIndex(i)
-        row.setElementAtIndex(j, value)
+        self.check_index(i, j)
+        self.mark_modified()
+        self.storage.setValue(self.writable_row(i), j, value)
+    
+    def get_row(self, i: int, start_col: int = 0, end_col: int = None) -> list:
+        self.check_index(i, start_col)
+        return self.storage.getRowValues(self.row_order[i], start_col, end_col).tolist()
+    
+    def set_row(self, i: int, values, start_col: int = 0):
+        self.check_index(i, start_col)
+        if start_col + len(values) > self.cols:
+            raise IndexError("Indice fuera de rango")
+        self.mark_modified()
+        self.storage.setRowValues(self.writable_row(i), array(self.storage.typecode, values), start_col)
     
     def swap_rows(self, i: int, j: int):
-        row_i = self.data.getElementAtIndex(i)
-        row_j = self.data.getElementAtIndex(j)
-        self.data.setElementAtIndex(i, row_j)
-        self.data.setElementAtIndex(j, row_i)
-    
-    def scale_row(self, i: int, scalar: float):
-        row = self.data.getElementAtIndex(i)
-        current = row.headNode
-        while current:
-            current.elementData *= scalar
-            current = current.nextNode
-    
-    def add_row(self, source_idx: int, target_idx: int, scalar: float = 1.0):
-        source = self.data.getElementAtIndex(source_idx)
-        target = self.data.getElementAtIndex(target_idx)
-        
-        source_node = source.headNode
-        target_node = target.headNode
-        
-        while source_node and target_node:
-            target_node.elementData += scalar * source_node.elementData
-            source_node = source_node.nextNode
-            target_node = target_node.nextNode
+        self.check_index(i, 0)
+        self.check_index(j, 0)
+        self.mark_modified()
+        self.row_order[i], self.row_order[j] = self.row_order[j], self.row_order[i]
+    
+    def swap_columns(self, i: int, j: int):
+        self.check_index(0, i)
+        self.check_index(0, j)
+        self.mark_modified()
+        for row in range(self.rows):
+            physical_row = self.writable_row(row)
+            first_value = self.storage.getValue(physical_row, i)
+            self.storage.setValue(physical_row, i, self.storage.getValue(physical_row, j))
+            self.storage.setValue(physical_row, j, first_value)
+    
+    def scale_row(self, i: int, scalar: float, start_col: int = 0):
+        self.check_index(i, start_col)
+        self.mark_modified()
+        self.storage.scaleRow(self.writable_row(i), scalar, start_col)
+    
+    def add_row(self, source_idx: int, target_idx: int, scalar: float = 1.0, start_col: int = 0, end_col: int = None):
+        self.check_index(source_idx, start_col)
+        self.check_index(target_idx, start_col)
+        self.mark_modified()
+        target_row = self.writable_row(target_idx)
+        self.storage.addScaledRow(self.row_order[source_idx], target_row, scalar, start_col, end_col)
+    
+    def view(self) -> MatrixView:
+        return MatrixView(self, range(self.rows), range(self.cols))
+    
+    def row_view(self, i: int) -> MatrixView:
+        return self.view()[i, :]
+    
+    def column_view(self, j: int) -> MatrixView:
+        return self.view()[:, j]
+    
+    def __getitem__(self, key):
+        return self.view()[key]
+    
+    def __setitem__(self, key, value):
+        self.view()[key] = value
     
     def is_square(self) -> bool:
         return self.rows == self.cols
     
-    def to_augmented(self, constants: LinkedList) -> 'Matrix':
-        if constants.getListLength() != self.rows:
-            raise MatrixDimensionsError("Número de constantes no coincide con filas")
+    def decomposition(self) -> LUFactorization:
+        return LUFactorization.for_matrix(self, 'complete')
+    
+    def check_square(self):
+        if not self.is_square():
+            raise MatrixDimensionsError(f"La matriz debe ser cuadrada: {self.rows}x{self.cols}")
+    
+    def determinant(self) -> float:
+        self.check_square()
+        return self.decomposition().determinant()
+    
+    def inverse(self) -> 'Matrix':
+        self.check_square()
+        decomposition = self.decomposition()
+        if decomposition.rank < self.rows:
+            raise SingularMatrixError("Matriz singular, no tiene inversa")
+        return decomposition.inverse()
+    
+    def rank(self) -> int:
+        if self.cols < self.rows:
+            return self.transpose().rank()
+        return self.decomposition().rank
+    
+    def to_augmented(self, constants) -> 'Matrix':
+        if isinstance(constants, Matrix):
+            if constants.rows != self.rows:
+                raise MatrixDimensionsError("Número de constantes no coincide con filas")
+            rhs_count = constants.cols
+            constant_rows = [constants.get_row(i) for i in range(self.rows)]
+        else:
+            if constants.getListLength() != self.rows:
+                raise MatrixDimensionsError("Número de constantes no coincide con filas")
+            rhs_count = 1
+            constant_rows = [[value] for value in constants]
+        
+        values = array(self.storage.typecode)
+        for i in range(self.rows):
+            values.extend(self.storage.copyRowRange(self.row_order[i], 1))
+            values.extend(constant_rows[i])
+        return Matrix.from_buffer(self.rows, self.cols + rhs_count, values)
     
     def add(self, other: 'Matrix') -> 'Matrix':
         if self.rows != other.rows or self.cols != other.cols:
@@ -62,19 +204,134 @@ class Matrix:
                 f"Dimensiones incompatibles para suma: "
                 f"{self.rows}x{self.cols} vs {other.rows}x{other.cols}"
             )
+        
+        values = array(self.result_typecode(other), map(add, self.logical_buffer(), other.logical_buffer()))
+        return Matrix.from_buffer(self.rows, self.cols, values)
     
-    def multiply(self, other: 'Matrix') -> 'Matrix':
+    def scalar_multiply(self, scalar: float) -> 'Matrix':
+        values = array(self.storage.typecode, [value * scalar for value in self.logical_buffer()])
+        return Matrix.from_buffer(self.rows, self.cols, values)
+    
+    def transpose(self, tile_size: int = 64) -> 'Matrix':
+        source = self.logical_buffer()
+        values = array(self.storage.typecode, [0.0]) * (self.rows * self.cols)
+        
+        for row_block in range(0, self.rows, tile_size):
+            block_end = min(row_block + tile_size, self.rows)
+            for col_block in range(0, self.cols, tile_size):
+                for j in range(col_block, min(col_block + tile_size, self.cols)):
+                    target_start = j * self.rows
+                    values[target_start + row_block:target_start + block_end] = \
+                        source[row_block * self.cols + j:block_end * self.cols:self.cols]
+        
+        return Matrix.from_buffer(self.cols, self.rows, values)
+    
+    def multiply(self, other: 'Matrix', multiplier: MatrixMultiplier = None) -> 'Matrix':
         if self.cols != other.rows:
             raise MatrixDimensionsError(
                 f"Dimensiones incompatibles para multiplicación: "
                 f"{self.rows}x{self.cols} vs {other.rows}x{other.cols}"
             )
+        
+        multiplier = multiplier or MatrixMultiplier()
+        left = self.logical_buffer()
+        right_columns = other.transpose().storage.buffer
+        values = multiplier.multiply_buffers(
+            left if left.typecode == 'd' else array('d', left),
+            right_columns if right_columns.typecode == 'd' else array('d', right_columns),
+            self.rows, self.cols, other.cols
+        )
+        typecode = self.result_typecode(other)
+        return Matrix.from_buffer(self.rows, other.cols, values if typecode == 'd' else array(typecode, values))
+    
+    def result_typecode(self, other: 'Matrix') -> str:
+        return self.storage.typecode if self.storage.typecode == other.storage.typecode else 'd'
+    
+    def logical_buffer(self) -> array:
+        if self.row_order == list(range(self.rows)) and len(self.storage.buffer) == self.rows * self.cols:
+            return self.storage.copyRowRange(0, self.rows)
+        
+        values = array(self.storage.typecode)
+        for physical_row in self.row_order:
+            values.extend(self.storage.copyRowRange(physical_row, 1))
+        return values
+    
+    def compact(self):
+        if self.row_order == list(range(self.rows)) and self.storage.isCompact():
+            return
+        
+        if self.storage.outOfCore:
+            if sum(self.storage.rowReferences) != self.rows:
+                raise ValueError("No se puede compactar una matriz en disco mientras otras copias comparten sus filas")
+            self.storage.storeRows(self.row_order)
+            self.row_order[:] = range(self.rows)
+            return
+        
+        values = self.logical_buffer()
+        self.row_release()
+        self.storage = DenseStorage(self.rows, self.cols, values, values.typecode)
+        self.row_order = list(range(self.rows))
+        self.row_release = weakref.finalize(self, self.storage.releaseRows, self.row_order)
+    
+    def to_memoryview(self, writable: bool = False) -> memoryview:
+        self.compact()
+        view = memoryview(self.storage.buffer)[:self.rows * self.cols]
+        if self.rows and self.cols:
+            view = view.cast('B').cast(view.format, [self.rows, self.cols])
+        if writable:
+            if self.storage.readOnly:
+                raise TypeError("El buffer de la matriz es de solo lectura")
+            self.mark_modified()
+            self.writable_exports.append(weakref.ref(view))
+            return view
+        return view.toreadonly()
+    
+    @staticmethod
+    def from_buffer(rows: int, cols: int, values, dtype: str = 'float64') -> 'Matrix':
+        if isinstance(values, array):
+            return Matrix(rows, cols, storage=DenseStorage(rows, cols, values, values.typecode))
+        
+        view = memoryview(values)
+        if not view.c_contiguous:
+            raise ValueError("El buffer debe ser contiguo")
+        source_format = view.format.lstrip('@=')
+        typecode = typecodeForDtype(dtype)
+        if source_format in ('d', 'f'):
+            typecode = source_format
+        elif source_format not in ('B', 'b', 'c'):
+            raise ValueError(f"Formato de buffer no soportado: {view.format}")
+        if view.nbytes != rows * cols * array(typecode).itemsize:
+            raise ValueError("El tamaño del buffer no coincide con las dimensiones")
+        if view.ndim != 1 or source_format != typecode:
+            view = view.cast('B').cast(typecode)
+        return Matrix(rows, cols, storage=DenseStorage(rows, cols, view, typecode))
+    
+    @staticmethod
+    def memory_mapped(rows: int, cols: int, file_path: str, data=None, create: bool = True,
+                      dtype: str = 'float64') -> 'Matrix':
+        storage = MappedStorage(rows, cols, file_path, create, typecodeForDtype(dtype))
+        return Matrix(rows, cols, data, storage=storage)
+    
+    @property
+    def dtype(self) -> str:
+        return dtypeForTypecode(self.storage.typecode)
+    
+    def is_out_of_core(self) -> bool:
+        return self.storage.outOfCore
+    
+    def flush(self):
+        if self.storage.outOfCore:
+            self.compact()
+            self.storage.flush()
+    
+    def close(self):
+        if self.storage.outOfCore:
+            self.storage.storeRows(self.row_order)
+            self.row_order[:] = range(self.rows)
+            self.storage.close()
+    
+    def write_to(self, stream, formatter: MatrixFormatter = None):
+        (formatter or MatrixFormatter()).write(self, stream)
     
     def __str__(self):
-        output = []
-        for i in range(self.rows):
-            row = []
-            for j in range(self.cols):
-                row.append(f"{self.get(i, j):.4f}")
-            output.append(" ".join(row))
-        return "\n".join(output)
\ No newline at end of file
+        return MatrixFormatter().to_string(self)
@@ -0,0 +1,89 @@
+from array import array
+from bisect import bisect_left
+from algebra.matrix import Matrix
+from algebra.almacenamiento import typecodeForDtype, dtypeForTypecode
+
+class SparseMatrix:
+    def __init__(self, rows: int, cols: int, values: array = None, col_indices: array = None, row_pointers: array = None):
+        self.rows = rows
+        self.cols = cols
+        self.values = values if values is not None else array('d')
+        self.col_indices = col_indices if col_indices is not None else array('l')
+        self.row_pointers = row_pointers if row_pointers is not None else array('l', [0]) * (rows + 1)
+        
+        if len(self.row_pointers) != rows + 1:
+            raise ValueError("row_pointers debe tener filas + 1 elementos")
+    
+    @staticmethod
+    def from_rows(rows: int, cols: int, data, dtype: str = 'float64') -> 'SparseMatrix':
+        values = array(typecodeForDtype(dtype))
+        col_indices = array('l')
+        row_pointers = array('l', [0])
+        
+        for i, row in enumerate(data):
+            if i >= rows:
+                break
+            for j, value in enumerate(row):
+                if j >= cols:
+                    break
+                if value != 0.0:
+                    values.append(value)
+                    col_indices.append(j)
+            row_pointers.append(len(values))
+        
+        while len(row_pointers) < rows + 1:
+            row_pointers.append(len(values))
+        
+        return SparseMatrix(rows, cols, values, col_indices, row_pointers)
+    
+    @staticmethod
+    def from_matrix(matrix: Matrix) -> 'SparseMatrix':
+        return SparseMatrix.from_rows(
+            matrix.rows, matrix.cols, (matrix.get_row(i) for i in range(matrix.rows)), matrix.dtype
+        )
+    
+    def check_index(self, i: int, j: int):
+        if i < 0 or i >= self.rows or j < 0 or j >= self.cols:
+            raise IndexError("Indice fuera de rango")
+    
+    def get(self, i: int, j: int) -> float:
+        self.check_index(i, j)
+        start = self.row_pointers[i]
+        end = self.row_pointers[i + 1]
+        position = bisect_left(self.col_indices, j, start, end)
+        if position < end and self.col_indices[position] == j:
+            return self.values[position]
+        return 0.0
+    
+    def get_row(self, i: int, start_col: int = 0, end_col: int = None) -> list:
+        self.check_index(i, start_col)
+        row = [0.0] * self.cols
+        for j, value in self.row_entries(i):
+            row[j] = value
+        return row[start_col:end_col]
+    
+    def row_entries(self, i: int):
+        for position in range(self.row_pointers[i], self.row_pointers[i + 1]):
+            yield self.col_indices[position], self.values[position]
+    
+    @property
+    def dtype(self) -> str:
+        return dtypeForTypecode(self.values.typecode)
+    
+    def nonzero_count(self) -> int:
+        return len(self.values)
+    
+    def density(self) -> float:
+        total_cells = self.rows * self.cols
+        return self.nonzero_count() / total_cells if total_cells else 0.0
+    
+    def to_dense(self) -> Matrix:
+        dense = Matrix(self.rows, self.cols, dtype=self.dtype)
+        for i in range(self.rows):
+            for j, value in self.row_entries(i):
+                dense.set(i, j, value)
+        return dense
+    
+    def __str__(self):
+        return (f"Matriz dispersa {self.rows}x{self.cols} "
+                f"({self.nonzero_count()} no nulos, densidad {self.density():.4f})")
@@ -0,0 +1,94 @@
+from array import array
+from operator import mul
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import os
+
+def multiply_row_band(left, right_columns, output, row_start: int, row_end: int,
+                      inner: int, cols: int, tile_size: int):
+    for col_block in range(0, cols, tile_size):
+        col_end = min(col_block + tile_size, cols)
+        for inner_block in range(0, inner, tile_size):
+            inner_end = min(inner_block + tile_size, inner)
+            column_segments = [
+                right_columns[j * inner + inner_block:j * inner + inner_end]
+                for j in range(col_block, col_end)
+            ]
+            for i in range(row_start, row_end):
+                row_segment = left[i * inner + inner_block:i * inner + inner_end]
+                base = i * cols + col_block
+                for offset, column_segment in enumerate(column_segments):
+                    output[base + offset] += sum(map(mul, row_segment, column_segment))
+
+def multiply_shared_band(left_name: str, right_name: str, output_name: str, row_start: int, row_end: int,
+                         inner: int, cols: int, tile_size: int):
+    blocks = [shared_memory.SharedMemory(name=name) for name in (left_name, right_name, output_name)]
+    views = [block.buf.cast('d') for block in blocks]
+    try:
+        multiply_row_band(views[0], views[1], views[2], row_start, row_end, inner, cols, tile_size)
+    finally:
+        for view in views:
+            view.release()
+        for block in blocks:
+            block.close()
+
+class MatrixMultiplier:
+    MODES = ('naive', 'blocked', 'parallel')
+    
+    def __init__(self, mode: str = 'blocked', tile_size: int = 64, workers: int = None):
+        if mode not in self.MODES:
+            raise ValueError(f"Modo de multiplicacion no soportado: {mode}")
+        if tile_size <= 0:
+            raise ValueError("El tamaño de bloque debe ser positivo")
+        self.mode = mode
+        self.tile_size = tile_size
+        self.workers = workers or os.cpu_count() or 1
+    
+    def multiply_buffers(self, left: array, right_columns: array, rows: int, inner: int, cols: int) -> array:
+        if self.mode == 'naive':
+            return self.multiply_naive(left, right_columns, rows, inner, cols)
+        if self.mode == 'parallel' and self.workers > 1 and rows > self.tile_size:
+            return self.multiply_parallel(left, right_columns, rows, inner, cols)
+        
+        output = array('d', [0.0]) * (rows * cols)
+        multiply_row_band(left, right_columns, output, 0, rows, inner, cols, self.tile_size)
+        return output
+    
+    def multiply_naive(self, left: array, right_columns: array, rows: int, inner: int, cols: int) -> array:
+        output = array('d', [0.0]) * (rows * cols)
+        for i in range(rows):
+            for j in range(cols):
+                total = 0.0
+                for k in range(inner):
+                    total += left[i * inner + k] * right_columns[j * inner + k]
+                output[i * cols + j] = total
+        return output
+    
+    def multiply_parallel(self, left: array, right_columns: array, rows: int, inner: int, cols: int) -> array:
+        item_size = left.itemsize
+        blocks = [
+            shared_memory.SharedMemory(create=True, size=max(1, length * item_size))
+            for length in (len(left), len(right_columns), rows * cols)
+        ]
+        try:
+            blocks[0].buf[:len(left) * item_size] = left.tobytes()
+            blocks[1].buf[:len(right_columns) * item_size] = right_columns.tobytes()
+            blocks[2].buf[:rows * cols * item_size] = bytes(rows * cols * item_size)
+            
+            band_size = max(self.tile_size, -(-rows // self.workers))
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                pending = [
+                    executor.submit(
+                        multiply_shared_band, blocks[0].name, blocks[1].name, blocks[2].name,
+                        row_start, min(row_start + band_size, rows), inner, cols, self.tile_size
+                    )
+                    for row_start in range(0, rows, band_size)
+                ]
+                for future in pending:
+                    future.result()
+            
+            return array('d', bytes(blocks[2].buf[:rows * cols * item_size]))
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
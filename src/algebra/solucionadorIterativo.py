@@ -0,0 +1,77 @@
+import math
+from operator import mul
+from algebra.matrix import Matrix
+from estructuras.listaEnlazada import LinkedList
+from errores.tiposErrores import MatrixDimensionsError
+
+class IterativeResult:
+    def __init__(self, method: str, values: list, iterations: int, converged: bool, residual_history: LinkedList):
+        self.method = method
+        self.solution = LinkedList()
+        for value in values:
+            self.solution.addElementAtEnd(value)
+        self.iterations = iterations
+        self.converged = converged
+        self.residual_history = residual_history
+    
+    def final_residual(self) -> float:
+        if self.residual_history.isEmpty():
+            return float('inf')
+        return self.residual_history.getElementAtIndex(self.residual_history.getListLength() - 1)
+    
+    def __str__(self):
+        status = "convergio" if self.converged else "no convergio"
+        return (f"{self.method}: {status} en {self.iterations} iteraciones, "
+                f"residuo relativo {self.final_residual():.3e}")
+
+def split_augmented_system(aug_matrix: Matrix) -> tuple:
+    if aug_matrix.cols != aug_matrix.rows + 1:
+        raise MatrixDimensionsError("Matriz aumentada debe tener n x (n+1)")
+    
+    n = aug_matrix.rows
+    coefficient_rows = []
+    constants = []
+    for i in range(n):
+        row = aug_matrix.get_row(i)
+        coefficient_rows.append(row[:n])
+        constants.append(row[n])
+    return coefficient_rows, constants
+
+def initial_values(initial_guess, size: int) -> list:
+    if initial_guess is None:
+        return [0.0] * size
+    values = list(initial_guess)
+    if len(values) != size:
+        raise MatrixDimensionsError("La aproximacion inicial no coincide con el numero de incognitas")
+    return values
+
+def relative_residual(coefficient_rows: list, constants: list, values: list, constants_norm: float) -> float:
+    residual_squared = 0.0
+    for row, constant in zip(coefficient_rows, constants):
+        difference = constant - sum(map(mul, row, values))
+        residual_squared += difference * difference
+    return math.sqrt(residual_squared) / constants_norm
+
+def vector_norm(values: list) -> float:
+    return math.sqrt(sum(map(mul, values, values)))
+
+def is_diagonally_dominant(aug_matrix: Matrix) -> bool:
+    n = aug_matrix.rows
+    for i in range(n):
+        row = aug_matrix.get_row(i)[:n]
+        diagonal = abs(row[i])
+        if diagonal <= sum(map(abs, row)) - diagonal:
+            return False
+    return True
+
+def is_symmetric_positive_diagonal(aug_matrix: Matrix, tolerance: float = 1e-12) -> bool:
+    n = aug_matrix.rows
+    for i in range(n):
+        if aug_matrix.get(i, i) <= 0.0:
+            return False
+        for j in range(i + 1, n):
+            upper = aug_matrix.get(i, j)
+            lower = aug_matrix.get(j, i)
+            if abs(upper - lower) > tolerance * max(1.0, abs(upper), abs(lower)):
+                return False
+    return True
@@ -1,7 +1,27 @@
 from algebra.matrix import Matrix
-from errores.tiposErrores import MatrixDimensionsError, SingularMatrixError
+from algebra.factorizacionLU import (
+    LUFactorization,
+    CholeskyFactorization,
+    row_maximum,
+    compute_scale_factors,
+    complete_pivoting
+)
+from algebra.matrizDispersa import SparseMatrix
+from algebra.estructuraMatriz import detect_structure, is_symmetric
+from algebra.eliminacionParalela import ParallelEliminator
+from algebra.solucionadorIterativo import (
+    IterativeResult,
+    split_augmented_system,
+    initial_values,
+    relative_residual,
+    vector_norm,
+    is_diagonally_dominant,
+    is_symmetric_positive_diagonal
+)
+from errores.tiposErrores import MatrixDimensionsError, SingularMatrixError, NonPositiveDefiniteError
 from estructuras.listaEnlazada import LinkedList
 import math
+from operator import mul
 
 class LinearSystemSolver:
     @staticmethod
@@ -26,12 +46,13 @@ class LinearSystemSolver:
                 aug_matrix.swap_rows(pivot, max_row)
             
             pivot_val = aug_matrix.get(pivot, pivot)
-            aug_matrix.scale_row(pivot, 1.0 / pivot_val)
+            aug_matrix.scale_row(pivot, 1.0 / pivot_val, start_col=pivot)
             
             for row in range(n):
                 if row != pivot:
                     factor = aug_matrix.get(row, pivot)
-                    aug_matrix.add_row(pivot, row, -factor)
+                    if factor != 0.0:
+                        aug_matrix.add_row(pivot, row, -factor, start_col=pivot)
         
         solution = LinkedList()
         for i in range(n):
@@ -39,16 +60,97 @@ class LinearSystemSolver:
         return solution
 
     @staticmethod
-    def gaussian_elimination(aug_matrix: Matrix, pivoting: str = 'partial') -> LinkedList:
+    def lu_solve(aug_matrix: Matrix, pivoting: str = 'partial') -> LinkedList:
+        if aug_matrix.cols != aug_matrix.rows + 1:
+            raise MatrixDimensionsError("Matriz aumentada debe tener n x (n+1)")
+        return LUFactorization.for_matrix(aug_matrix, pivoting).solve_augmented(aug_matrix)
+
+    @staticmethod
+    def mixed_precision_solve(aug_matrix: Matrix, pivoting: str = 'partial', tolerance: float = 1e-12,
+                              max_refinements: int = 10) -> IterativeResult:
+        coefficient_rows, constants = split_augmented_system(aug_matrix)
+        factorization = LUFactorization.for_matrix(aug_matrix, pivoting, typecode='f')
+        constants_norm = vector_norm(constants) or 1.0
+        residual_history = LinkedList()
+        
+        values = factorization.solve(constants)
+        residual = [constant - math.fsum(map(mul, row, values)) for row, constant in zip(coefficient_rows, constants)]
+        residual_history.addElementAtEnd(vector_norm(residual) / constants_norm)
+        
+        for step in range(1, max_refinements + 1):
+            correction = factorization.solve(residual)
+            values = [value + delta for value, delta in zip(values, correction)]
+            residual = [constant - math.fsum(map(mul, row, values)) for row, constant in zip(coefficient_rows, constants)]
+            residual_history.addElementAtEnd(vector_norm(residual) / constants_norm)
+            if vector_norm(correction) <= tolerance * (vector_norm(values) or 1.0):
+                return IterativeResult('precision mixta float32/float64', values, step, True, residual_history)
+        
+        return IterativeResult('precision mixta float32/float64', values, max_refinements, False, residual_history)
+
+    @staticmethod
+    def choose_pivoting(aug_matrix: Matrix, scaled_threshold: float = 1e6, complete_threshold: float = 1e10) -> tuple:
+        try:
+            condition = LUFactorization.for_matrix(aug_matrix, 'partial').estimate_condition()
+        except SingularMatrixError:
+            return 'complete', math.inf
+        
+        if condition >= complete_threshold:
+            return 'complete', condition
+        if condition >= scaled_threshold:
+            return 'scaled', condition
+        return 'partial', condition
+
+    @staticmethod
+    def cholesky_solve(aug_matrix: Matrix) -> LinkedList:
+        if aug_matrix.cols != aug_matrix.rows + 1:
+            raise MatrixDimensionsError("Matriz aumentada debe tener n x (n+1)")
+        return CholeskyFactorization.for_matrix(aug_matrix).solve_augmented(aug_matrix)
+
+    @staticmethod
+    def factorize(matrix: Matrix, pivoting: str = 'partial') -> LUFactorization:
+        structure = matrix.structure
+        symmetric = structure.symmetric if structure is not None else is_symmetric(matrix)
+        if symmetric and matrix.factorization_cache.get('cholesky_failed') != matrix.version:
+            try:
+                return CholeskyFactorization.for_matrix(matrix)
+            except NonPositiveDefiniteError:
+                matrix.factorization_cache['cholesky_failed'] = matrix.version
+        return LUFactorization.for_matrix(matrix, pivoting)
+
+    @staticmethod
+    def solve_multiple(aug_matrix: Matrix, pivoting: str = 'partial') -> Matrix:
+        if aug_matrix.cols <= aug_matrix.rows:
+            raise MatrixDimensionsError("Matriz aumentada debe tener n x (n+k) con k >= 1")
+        return LinearSystemSolver.factorize(aug_matrix, pivoting).solve_right_hand_sides(aug_matrix)
+
+    @staticmethod
+    def gaussian_elimination(aug_matrix: Matrix, pivoting: str = 'partial', panel_size: int = None,
+                             workers: int = None) -> LinkedList:
         n = aug_matrix.rows
         
+        if workers is not None and workers > 1 and pivoting in ParallelEliminator.PIVOTING_STRATEGIES:
+            return LinearSystemSolver.parallel_gaussian_elimination(aug_matrix, workers, pivoting)
+        if panel_size is None and aug_matrix.is_out_of_core():
+            panel_size = 64
+        if panel_size and pivoting in ('partial', 'scaled'):
+            return LinearSystemSolver.panel_gaussian_elimination(aug_matrix, panel_size, pivoting)
+        
+        col_permutation = list(range(n))
+        row_maxima = None
+        scale_factors = None
+        if pivoting == 'complete':
+            row_maxima = [row_maximum(aug_matrix, row, 0, n) for row in range(n)]
+        elif pivoting == 'scaled':
+            scale_factors = compute_scale_factors(aug_matrix, n)
+        
         for pivot in range(n):
             if pivoting == 'partial':
                 LinearSystemSolver.partial_pivoting(aug_matrix, pivot)
             elif pivoting == 'scaled':
-                LinearSystemSolver.scaled_pivoting(aug_matrix, pivot)
+                LinearSystemSolver.scaled_pivoting(aug_matrix, pivot, scale_factors)
             elif pivoting == 'complete':
-                LinearSystemSolver.complete_pivoting(aug_matrix, pivot)
+                max_col = LinearSystemSolver.complete_pivoting(aug_matrix, pivot, row_maxima)
+                col_permutation[pivot], col_permutation[max_col] = col_permutation[max_col], col_permutation[pivot]
             
             pivot_val = aug_matrix.get(pivot, pivot)
             if abs(pivot_val) < 1e-10:
@@ -56,17 +158,374 @@ class LinearSystemSolver:
             
             for row in range(pivot + 1, n):
                 factor = aug_matrix.get(row, pivot) / pivot_val
-                aug_matrix.add_row(pivot, row, -factor)
+                if factor != 0.0:
+                    aug_matrix.add_row(pivot, row, -factor, start_col=pivot)
+                if row_maxima is not None and (factor != 0.0 or row_maxima[row][1] <= pivot):
+                    row_maxima[row] = row_maximum(aug_matrix, row, pivot + 1, n)
         
-        solution = LinkedList()
+        return LinearSystemSolver.back_substitution(aug_matrix, col_permutation)
+
+    @staticmethod
+    def parallel_gaussian_elimination(aug_matrix: Matrix, workers: int = None, pivoting: str = 'partial',
+                                      min_rows_per_task: int = 32) -> LinkedList:
+        if aug_matrix.cols != aug_matrix.rows + 1:
+            raise MatrixDimensionsError("Matriz aumentada debe tener n x (n+1)")
+        reduced = ParallelEliminator(workers, min_rows_per_task).eliminate(aug_matrix, pivoting)
+        return LinearSystemSolver.back_substitution(reduced)
+
+    @staticmethod
+    def panel_gaussian_elimination(aug_matrix: Matrix, panel_size: int = 64, pivoting: str = 'partial') -> LinkedList:
+        if aug_matrix.cols != aug_matrix.rows + 1:
+            raise MatrixDimensionsError("Matriz aumentada debe tener n x (n+1)")
+        
+        n = aug_matrix.rows
+        scale_factors = compute_scale_factors(aug_matrix, n) if pivoting == 'scaled' else [1.0] * n
+        
+        for panel_start in range(0, n, panel_size):
+            panel_end = min(panel_start + panel_size, n)
+            multipliers = {}
+            
+            for pivot in range(panel_start, panel_end):
+                max_row = max(range(pivot, n), key=lambda row: abs(aug_matrix.get(row, pivot)) / scale_factors[row])
+                if max_row != pivot:
+                    aug_matrix.swap_rows(pivot, max_row)
+                    scale_factors[pivot], scale_factors[max_row] = scale_factors[max_row], scale_factors[pivot]
+                    pivot_multipliers = multipliers.pop(pivot, None)
+                    if max_row in multipliers:
+                        multipliers[pivot] = multipliers.pop(max_row)
+                    if pivot_multipliers is not None:
+                        multipliers[max_row] = pivot_multipliers
+                
+                pivot_val = aug_matrix.get(pivot, pivot)
+                if abs(pivot_val) < 1e-10:
+                    raise SingularMatrixError("Matriz singular o mal condicionada")
+                
+                for row in range(pivot + 1, n):
+                    factor = aug_matrix.get(row, pivot) / pivot_val
+                    if factor != 0.0:
+                        multipliers.setdefault(row, []).append((pivot, factor))
+                        aug_matrix.add_row(pivot, row, -factor, start_col=pivot, end_col=panel_end)
+            
+            pivot_segments = {
+                pivot: aug_matrix.get_row(pivot, panel_end) for pivot in range(panel_start, panel_end)
+            }
+            for row in range(panel_start + 1, n):
+                row_multipliers = multipliers.get(row)
+                if not row_multipliers:
+                    continue
+                target = aug_matrix.get_row(row, panel_end)
+                for pivot, factor in row_multipliers:
+                    target = [value - factor * source for value, source in zip(target, pivot_segments[pivot])]
+                if row < panel_end:
+                    pivot_segments[row] = target
+                aug_matrix.set_row(row, target, panel_end)
+        
+        return LinearSystemSolver.back_substitution(aug_matrix)
+
+    @staticmethod
+    def back_substitution(aug_matrix: Matrix, col_permutation: list = None) -> LinkedList:
+        n = aug_matrix.rows
+        values = [0.0] * n
         for i in range(n-1, -1, -1):
-            total = aug_matrix.get(i, n)
-            for j in range(i+1, n):
-                total -= aug_matrix.get(i, j) * solution.getElementAtIndex(j)
-            solution.addElementAtBeginning(total / aug_matrix.get(i, i))
+            row = aug_matrix.get_row(i, i)
+            total = row[n - i]
+            for offset in range(1, n - i):
+                total -= row[offset] * values[i + offset]
+            values[i] = total / row[0]
+        
+        if col_permutation is not None:
+            unpermuted = [0.0] * n
+            for position, original_col in enumerate(col_permutation):
+                unpermuted[original_col] = values[position]
+            values = unpermuted
+        
+        solution = LinkedList()
+        for value in values:
+            solution.addElementAtEnd(value)
+        return solution
+
+    @staticmethod
+    def sparse_gaussian_elimination(aug_matrix: SparseMatrix, pivot_threshold: float = 0.1) -> LinkedList:
+        if aug_matrix.cols != aug_matrix.rows + 1:
+            raise MatrixDimensionsError("Matriz aumentada debe tener n x (n+1)")
+        
+        n = aug_matrix.rows
+        row_maps = []
+        constants = [0.0] * n
+        column_rows = [set() for _ in range(n)]
+        
+        for i in range(n):
+            row_map = {}
+            for j, value in aug_matrix.row_entries(i):
+                if j == n:
+                    constants[i] = value
+                else:
+                    row_map[j] = value
+                    column_rows[j].add(i)
+            row_maps.append(row_map)
+        
+        pivot_rows = [0] * n
+        for pivot in range(n):
+            candidates = column_rows[pivot]
+            max_val = max((abs(row_maps[row][pivot]) for row in candidates), default=0.0)
+            if max_val < 1e-10:
+                raise SingularMatrixError("Matriz singular o mal condicionada")
+            
+            pivot_row = min(
+                (row for row in candidates if abs(row_maps[row][pivot]) >= pivot_threshold * max_val),
+                key=lambda row: (len(row_maps[row]), -abs(row_maps[row][pivot]))
+            )
+            pivot_rows[pivot] = pivot_row
+            pivot_map = row_maps[pivot_row]
+            pivot_val = pivot_map[pivot]
+            
+            for col in pivot_map:
+                column_rows[col].discard(pivot_row)
+            
+            for row in list(candidates):
+                target_map = row_maps[row]
+                factor = target_map[pivot] / pivot_val
+                for col, value in pivot_map.items():
+                    updated = target_map.get(col, 0.0) - factor * value
+                    if col == pivot or updated == 0.0:
+                        if col in target_map:
+                            del target_map[col]
+                            column_rows[col].discard(row)
+                    else:
+                        if col not in target_map:
+                            column_rows[col].add(row)
+                        target_map[col] = updated
+                constants[row] -= factor * constants[pivot_row]
+        
+        values = [0.0] * n
+        for pivot in range(n - 1, -1, -1):
+            pivot_row = pivot_rows[pivot]
+            total = constants[pivot_row]
+            for col, value in row_maps[pivot_row].items():
+                if col != pivot:
+                    total -= value * values[col]
+            values[pivot] = total / row_maps[pivot_row][pivot]
+        
+        solution = LinkedList()
+        for value in values:
+            solution.addElementAtEnd(value)
+        return solution
+
+    @staticmethod
+    def thomas_algorithm(aug_matrix: Matrix) -> LinkedList:
+        if aug_matrix.cols != aug_matrix.rows + 1:
+            raise MatrixDimensionsError("Matriz aumentada debe tener n x (n+1)")
+        
+        n = aug_matrix.rows
+        upper = [0.0] * n
+        constants = [0.0] * n
+        previous_upper = 0.0
+        previous_constant = 0.0
+        
+        for i in range(n):
+            lower_val = aug_matrix.get(i, i - 1) if i > 0 else 0.0
+            denominator = aug_matrix.get(i, i) - lower_val * previous_upper
+            if abs(denominator) < 1e-10:
+                raise SingularMatrixError("Pivote nulo en algoritmo de Thomas")
+            upper[i] = aug_matrix.get(i, i + 1) / denominator if i < n - 1 else 0.0
+            constants[i] = (aug_matrix.get(i, n) - lower_val * previous_constant) / denominator
+            previous_upper = upper[i]
+            previous_constant = constants[i]
+        
+        values = [0.0] * n
+        for i in range(n - 1, -1, -1):
+            values[i] = constants[i] - (upper[i] * values[i + 1] if i < n - 1 else 0.0)
         
+        solution = LinkedList()
+        for value in values:
+            solution.addElementAtEnd(value)
         return solution
 
+    @staticmethod
+    def banded_gaussian_elimination(aug_matrix: Matrix, lower_bandwidth: int, upper_bandwidth: int) -> LinkedList:
+        if aug_matrix.cols != aug_matrix.rows + 1:
+            raise MatrixDimensionsError("Matriz aumentada debe tener n x (n+1)")
+        
+        n = aug_matrix.rows
+        width = 2 * lower_bandwidth + upper_bandwidth + 1
+        band_rows = []
+        for i in range(n):
+            first_col = max(0, i - lower_bandwidth)
+            end_col = min(n, first_col + width)
+            segment = aug_matrix.get_row(i, first_col)[:end_col - first_col]
+            segment.extend([0.0] * (width - len(segment)))
+            band_rows.append([first_col, segment, aug_matrix.get(i, n)])
+        
+        for pivot in range(n):
+            last_row = min(n, pivot + lower_bandwidth + 1)
+            max_row = max(range(pivot, last_row), key=lambda r: abs(band_rows[r][1][pivot - band_rows[r][0]]))
+            if abs(band_rows[max_row][1][pivot - band_rows[max_row][0]]) < 1e-10:
+                raise SingularMatrixError("Matriz singular o mal condicionada")
+            band_rows[pivot], band_rows[max_row] = band_rows[max_row], band_rows[pivot]
+            
+            pivot_first, pivot_segment, pivot_constant = band_rows[pivot]
+            pivot_val = pivot_segment[pivot - pivot_first]
+            end_col = min(n, pivot + lower_bandwidth + upper_bandwidth + 1)
+            pivot_values = pivot_segment[pivot - pivot_first:end_col - pivot_first]
+            
+            for row in range(pivot + 1, last_row):
+                target = band_rows[row]
+                target_first, target_segment = target[0], target[1]
+                factor = target_segment[pivot - target_first] / pivot_val
+                start = pivot - target_first
+                stop = start + len(pivot_values)
+                updated = [
+                    value - factor * pivot_value
+                    for value, pivot_value in zip(target_segment[start + 1:stop], pivot_values[1:])
+                ]
+                updated.extend(target_segment[stop:])
+                updated.extend([0.0] * (width - len(updated)))
+                target[0] = pivot + 1
+                target[1] = updated
+                target[2] -= factor * pivot_constant
+        
+        values = [0.0] * n
+        for i in range(n - 1, -1, -1):
+            first_col, segment, total = band_rows[i]
+            end_col = min(n, i + lower_bandwidth + upper_bandwidth + 1)
+            for col in range(i + 1, end_col):
+                total -= segment[col - first_col] * values[col]
+            values[i] = total / segment[i - first_col]
+        
+        solution = LinkedList()
+        for value in values:
+            solution.addElementAtEnd(value)
+        return solution
+
+    @staticmethod
+    def banded_solve(aug_matrix: Matrix, structure=None) -> LinkedList:
+        structure = structure or aug_matrix.structure or detect_structure(aug_matrix)
+        if structure.kind in ('diagonal', 'tridiagonal'):
+            try:
+                return LinearSystemSolver.thomas_algorithm(aug_matrix)
+            except SingularMatrixError:
+                pass
+        return LinearSystemSolver.banded_gaussian_elimination(
+            aug_matrix, structure.lower_bandwidth, structure.upper_bandwidth
+        )
+
+    @staticmethod
+    def jacobi(aug_matrix: Matrix, tolerance: float = 1e-10, max_iterations: int = 1000,
+               initial_guess=None) -> IterativeResult:
+        coefficient_rows, constants = split_augmented_system(aug_matrix)
+        n = aug_matrix.rows
+        values = initial_values(initial_guess, n)
+        constants_norm = vector_norm(constants) or 1.0
+        residual_history = LinkedList()
+        
+        for iteration in range(1, max_iterations + 1):
+            updated = [
+                values[i] + (constants[i] - sum(map(mul, coefficient_rows[i], values))) / coefficient_rows[i][i]
+                for i in range(n)
+            ]
+            values = updated
+            residual = relative_residual(coefficient_rows, constants, values, constants_norm)
+            residual_history.addElementAtEnd(residual)
+            if residual <= tolerance or not math.isfinite(residual):
+                return IterativeResult('jacobi', values, iteration, residual <= tolerance, residual_history)
+        
+        return IterativeResult('jacobi', values, max_iterations, False, residual_history)
+
+    @staticmethod
+    def gauss_seidel(aug_matrix: Matrix, tolerance: float = 1e-10, max_iterations: int = 1000,
+                     initial_guess=None) -> IterativeResult:
+        result = LinearSystemSolver.sor(aug_matrix, 1.0, tolerance, max_iterations, initial_guess)
+        result.method = 'gauss_seidel'
+        return result
+
+    @staticmethod
+    def sor(aug_matrix: Matrix, relaxation: float = 1.25, tolerance: float = 1e-10, max_iterations: int = 1000,
+            initial_guess=None) -> IterativeResult:
+        if not 0.0 < relaxation < 2.0:
+            raise ValueError("El factor de relajacion debe estar en (0, 2)")
+        
+        coefficient_rows, constants = split_augmented_system(aug_matrix)
+        n = aug_matrix.rows
+        values = initial_values(initial_guess, n)
+        constants_norm = vector_norm(constants) or 1.0
+        residual_history = LinkedList()
+        
+        for iteration in range(1, max_iterations + 1):
+            for i in range(n):
+                row = coefficient_rows[i]
+                correction = (constants[i] - sum(map(mul, row, values))) / row[i]
+                values[i] += relaxation * correction
+            residual = relative_residual(coefficient_rows, constants, values, constants_norm)
+            residual_history.addElementAtEnd(residual)
+            if residual <= tolerance or not math.isfinite(residual):
+                return IterativeResult('sor', values, iteration, residual <= tolerance, residual_history)
+        
+        return IterativeResult('sor', values, max_iterations, False, residual_history)
+
+    @staticmethod
+    def conjugate_gradient(aug_matrix: Matrix, tolerance: float = 1e-10, max_iterations: int = None,
+                           initial_guess=None) -> IterativeResult:
+        n = aug_matrix.rows
+        if not is_symmetric(aug_matrix, n):
+            raise NonPositiveDefiniteError("El gradiente conjugado requiere una matriz simetrica definida positiva")
+        
+        coefficient_rows, constants = split_augmented_system(aug_matrix)
+        max_iterations = max_iterations or 2 * n
+        values = initial_values(initial_guess, n)
+        constants_norm = vector_norm(constants) or 1.0
+        residual_history = LinkedList()
+        
+        residual = [constant - sum(map(mul, row, values)) for row, constant in zip(coefficient_rows, constants)]
+        direction = list(residual)
+        residual_squared = sum(map(mul, residual, residual))
+        
+        for iteration in range(1, max_iterations + 1):
+            product = [sum(map(mul, row, direction)) for row in coefficient_rows]
+            curvature = sum(map(mul, direction, product))
+            if curvature <= 0.0:
+                raise NonPositiveDefiniteError("La matriz no es definida positiva")
+            
+            step = residual_squared / curvature
+            values = [value + step * component for value, component in zip(values, direction)]
+            residual = [value - step * component for value, component in zip(residual, product)]
+            updated_squared = sum(map(mul, residual, residual))
+            
+            relative = math.sqrt(updated_squared) / constants_norm
+            residual_history.addElementAtEnd(relative)
+            if relative <= tolerance:
+                return IterativeResult('conjugate_gradient', values, iteration, True, residual_history)
+            
+            direction = [value + (updated_squared / residual_squared) * component
+                         for value, component in zip(residual, direction)]
+            residual_squared = updated_squared
+        
+        return IterativeResult('conjugate_gradient', values, max_iterations, False, residual_history)
+
+    @staticmethod
+    def choose_iterative_method(aug_matrix: Matrix) -> str:
+        if aug_matrix.cols != aug_matrix.rows + 1 or aug_matrix.rows == 0:
+            return None
+        if is_symmetric_positive_diagonal(aug_matrix) and is_diagonally_dominant(aug_matrix):
+            return 'conjugate_gradient'
+        if is_diagonally_dominant(aug_matrix):
+            return 'gauss_seidel'
+        return None
+
+    @staticmethod
+    def iterative_solve(aug_matrix: Matrix, method: str, tolerance: float = 1e-10, max_iterations: int = None,
+                        initial_guess=None) -> IterativeResult:
+        if method == 'conjugate_gradient':
+            return LinearSystemSolver.conjugate_gradient(aug_matrix, tolerance, max_iterations, initial_guess)
+        
+        max_iterations = max_iterations or 1000
+        if method == 'jacobi':
+            return LinearSystemSolver.jacobi(aug_matrix, tolerance, max_iterations, initial_guess)
+        if method == 'gauss_seidel':
+            return LinearSystemSolver.gauss_seidel(aug_matrix, tolerance, max_iterations, initial_guess)
+        if method == 'sor':
+            return LinearSystemSolver.sor(aug_matrix, 1.25, tolerance, max_iterations, initial_guess)
+        raise ValueError(f"Metodo iterativo no soportado: {method}")
+
     @staticmethod
     def partial_pivoting(matrix: Matrix, pivot: int):
         max_row = pivot
@@ -79,11 +538,9 @@ class LinearSystemSolver:
             matrix.swap_rows(pivot, max_row)
 
     @staticmethod
-    def scaled_pivoting(matrix: Matrix, pivot: int):
-        scale_factors = []
-        for i in range(matrix.rows):
-            max_in_row = max(abs(matrix.get(i, j)) for j in range(matrix.cols))
-            scale_factors.append(max_in_row if max_in_row > 0 else 1.0)
+    def scaled_pivoting(matrix: Matrix, pivot: int, scale_factors: list = None):
+        if scale_factors is None:
+            scale_factors = compute_scale_factors(matrix, min(matrix.rows, matrix.cols))
         
         max_ratio = -1
         max_row = pivot
@@ -95,19 +552,8 @@ class LinearSystemSolver:
         
         if max_row != pivot:
             matrix.swap_rows(pivot, max_row)
+            scale_factors[pivot], scale_factors[max_row] = scale_factors[max_row], scale_factors[pivot]
 
     @staticmethod
-    def complete_pivoting(matrix: Matrix, pivot: int):
-        max_val = 0
-        max_row = pivot
-        max_col = pivot
-        
-        for i in range(pivot, matrix.rows):
-            for j in range(pivot, matrix.cols - 1):  
-                if abs(matrix.get(i, j)) > max_val:
-                    max_val = abs(matrix.get(i, j))
-                    max_row = i
-                    max_col = j
-        
-        if max_row != pivot:
-            matrix.swap_rows(pivot, max_row)
+    def complete_pivoting(matrix: Matrix, pivot: int, row_maxima: list = None) -> int:
+        return complete_pivoting(matrix, pivot, row_maxima)
@@ -0,0 +1,139 @@
+from array import array
+from numbers import Number
+from operator import add, sub, mul, truediv
+from algebra.formatoMatriz import MatrixFormatter
+
+class MatrixView:
+    def __init__(self, parent, row_range: range, col_range: range):
+        if row_range.step < 0 or col_range.step < 0:
+            raise ValueError("Las vistas no admiten pasos negativos")
+        self.parent = parent
+        self.row_range = row_range
+        self.col_range = col_range
+    
+    @property
+    def rows(self) -> int:
+        return len(self.row_range)
+    
+    @property
+    def cols(self) -> int:
+        return len(self.col_range)
+    
+    def check_index(self, i: int, j: int):
+        if i < 0 or i >= self.rows or j < 0 or j >= self.cols:
+            raise IndexError("Indice fuera de rango")
+    
+    def get(self, i: int, j: int) -> float:
+        self.check_index(i, j)
+        return self.parent.get(self.row_range[i], self.col_range[j])
+    
+    def set(self, i: int, j: int, value: float):
+        self.check_index(i, j)
+        self.parent.set(self.row_range[i], self.col_range[j], value)
+    
+    def physical_slice(self, physical_row: int, start_col: int = 0, end_col: int = None) -> tuple:
+        cols = self.col_range[start_col:end_col]
+        buffer, row_start = self.parent.storage.rowLocation(physical_row)
+        return buffer, slice(row_start + cols.start, row_start + cols.stop, cols.step)
+    
+    def get_row(self, i: int, start_col: int = 0, end_col: int = None) -> list:
+        self.check_index(i, start_col)
+        buffer, source = self.physical_slice(self.parent.row_order[self.row_range[i]], start_col, end_col)
+        return buffer[source].tolist()
+    
+    def set_row(self, i: int, values, start_col: int = 0):
+        self.check_index(i, start_col)
+        if start_col + len(values) > self.cols:
+            raise IndexError("Indice fuera de rango")
+        self.parent.mark_modified()
+        physical_row = self.parent.writable_row(self.row_range[i])
+        buffer, target = self.physical_slice(physical_row, start_col, start_col + len(values))
+        buffer[target] = array(self.parent.storage.typecode, values)
+    
+    def update_rows(self, operation, operand):
+        if isinstance(operand, Number):
+            operand_row = None
+        elif operand.rows != self.rows or operand.cols != self.cols:
+            raise ValueError(
+                f"Dimensiones incompatibles: {self.rows}x{self.cols} vs {operand.rows}x{operand.cols}"
+            )
+        
+        if self.cols == 0:
+            return self
+        
+        operand_rows = None
+        if not isinstance(operand, Number) and self.shares_storage(operand):
+            operand_rows = [operand.get_row(i) for i in range(operand.rows)]
+        
+        self.parent.mark_modified()
+        for i, parent_row in enumerate(self.row_range):
+            if isinstance(operand, Number):
+                operand_row = [operand] * self.cols
+            elif operand_rows is not None:
+                operand_row = operand_rows[i]
+            else:
+                operand_row = operand.get_row(i)
+            physical_row = self.parent.writable_row(parent_row)
+            buffer, target = self.physical_slice(physical_row)
+            buffer[target] = array(self.parent.storage.typecode, map(operation, buffer[target], operand_row))
+        return self
+    
+    def shares_storage(self, operand) -> bool:
+        operand_storage = operand.parent.storage if isinstance(operand, MatrixView) else operand.storage
+        return operand_storage is self.parent.storage
+    
+    def __iadd__(self, operand) -> 'MatrixView':
+        return self.update_rows(add, operand)
+    
+    def __isub__(self, operand) -> 'MatrixView':
+        return self.update_rows(sub, operand)
+    
+    def __imul__(self, operand) -> 'MatrixView':
+        return self.update_rows(mul, operand)
+    
+    def __itruediv__(self, operand) -> 'MatrixView':
+        return self.update_rows(truediv, operand)
+    
+    def assign(self, operand):
+        return self.update_rows(lambda current, new: new, operand)
+    
+    def same_region(self, other) -> bool:
+        return (isinstance(other, MatrixView) and other.parent is self.parent
+                and other.row_range == self.row_range and other.col_range == self.col_range)
+    
+    def __getitem__(self, key):
+        row_key, col_key = key if isinstance(key, tuple) else (key, slice(None))
+        if isinstance(row_key, int) and isinstance(col_key, int):
+            return self.get(*self.normalize_index(row_key, col_key))
+        
+        return MatrixView(self.parent, self.sub_range(self.row_range, row_key),
+                          self.sub_range(self.col_range, col_key))
+    
+    def __setitem__(self, key, value):
+        if isinstance(key, tuple) and isinstance(key[0], int) and isinstance(key[1], int):
+            self.set(*self.normalize_index(*key), value)
+            return
+        target = self[key]
+        if not target.same_region(value):
+            target.assign(value)
+    
+    def normalize_index(self, i: int, j: int) -> tuple:
+        return (i + self.rows if i < 0 else i), (j + self.cols if j < 0 else j)
+    
+    @staticmethod
+    def sub_range(source: range, key) -> range:
+        if isinstance(key, slice):
+            return source[key]
+        if key < -len(source) or key >= len(source):
+            raise IndexError("Indice fuera de rango")
+        start = source[key]
+        return range(start, start + 1)
+    
+    def to_matrix(self):
+        values = array(self.parent.storage.typecode)
+        for i in range(self.rows):
+            values.extend(self.get_row(i) if self.cols else [])
+        return type(self.parent).from_buffer(self.rows, self.cols, values)
+    
+    def __str__(self):
+        return MatrixFormatter().to_string(self)
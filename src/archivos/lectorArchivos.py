@@ -1,5 +1,9 @@
 from estructuras.listaEnlazada import LinkedList
+from estructuras.secuencias import createSequence, createFloatSequence
+from estructuras.canal import Channel
 from algebra.matrix import Matrix
+from algebra.matrizDispersa import SparseMatrix
+from algebra.estructuraMatriz import detect_structure
 from numeros.binario import Binary
 from numeros.decimal import Decimal
 from numeros.hexadecimal import Hexadecimal
@@ -12,13 +16,18 @@ from errores.tiposErrores import (
 )
 
 class FileReader:
-    def __init__(self):
-        self.processedData = LinkedList()
-        self.errorLog = LinkedList()
+    def __init__(self, sequenceType: str = None):
+        self.sequenceType = sequenceType
+        self.resetState()
+    
+    def resetState(self):
+        self.processedData = createSequence(self.sequenceType)
+        self.errorLog = createSequence(self.sequenceType)
         self.totalRows = 0
         self.totalColumns = 0
     
-    def processInputFile(self, filePath: str) -> LinkedList:
+    def processInputFile(self, filePath: str, rowChannel: Channel = None) -> LinkedList:
+        self.resetState()
         fileName = self.extractFileNameFromPath(filePath)
         
         
@@ -34,7 +43,7 @@ class FileReader:
         else:
             rawLines = self.readTextFileLines(filePath)
             
-        self.processAllLines(rawLines)
+        self.processAllLines(rawLines, rowChannel)
         
         return self.processedData
     
@@ -53,7 +62,7 @@ class FileReader:
             return False
     
     def readBinaryFile(self, filePath: str) -> LinkedList:
-        linesQueue = LinkedList()
+        linesQueue = createSequence(self.sequenceType)
         
         try:
             with open(filePath, 'rb') as file:
@@ -83,7 +92,7 @@ class FileReader:
         return linesQueue
     
     def readTextFileLines(self, filePath: str) -> LinkedList:
-        lines = LinkedList()
+        lines = createSequence(self.sequenceType)
         try:
             with open(filePath, 'r', encoding='utf-8') as file:
                 for line in file:
@@ -95,7 +104,7 @@ class FileReader:
         return lines
     
     def extractFileNameFromPath(self, path: str) -> str:
-        pathParts = LinkedList()
+        pathParts = createSequence(self.sequenceType)
         currentSegment = ""
         
         for char in path:
@@ -112,7 +121,7 @@ class FileReader:
         return pathParts.getElementAtIndex(pathParts.getListLength() - 1) if pathParts.getListLength() > 0 else ""
     
     def readFileLines(self, filePath: str) -> LinkedList:
-        linesQueue = LinkedList()
+        linesQueue = createSequence(self.sequenceType)
         
         try:
             with open(filePath, 'r', encoding='utf-8') as file:
@@ -137,12 +146,11 @@ class FileReader:
             
         return linesQueue
     
-    def processAllLines(self, linesQueue: LinkedList):
-        currentLineNode = linesQueue.headNode
+    def processAllLines(self, linesQueue: LinkedList, rowChannel: Channel = None):
         lineCounter = 1
         
-        while currentLineNode:
-            processedRow = self.processSingleLine(currentLineNode.elementData, lineCounter)
+        for lineContent in linesQueue:
+            processedRow = self.processSingleLine(lineContent, lineCounter)
             
             if processedRow.getListLength() > self.totalColumns:
                 self.totalColumns = processedRow.getListLength()
@@ -150,29 +158,27 @@ class FileReader:
             if processedRow.getListLength() > 0:
                 self.processedData.addElementAtEnd(processedRow)
                 self.totalRows += 1
+                if rowChannel is not None:
+                    rowChannel.sendElement(processedRow)
             
-            currentLineNode = currentLineNode.nextNode
             lineCounter += 1
     
     def processSingleLine(self, lineContent: str, lineNumber: int) -> LinkedList:
-        rowData = LinkedList()
+        rowData = createSequence(self.sequenceType)
         fields = self.splitFields(lineContent)
-        currentFieldNode = fields.headNode
         
-        while currentFieldNode:
-            rawValue = currentFieldNode.elementData
+        for rawValue in fields:
             if rawValue:
                 try:
                     numberObj = self.createNumberObject(rawValue)
                     rowData.addElementAtEnd(numberObj)
                 except InvalidNumberFormatError as formatError:
                     self.logError(lineNumber, rawValue, str(formatError))
-            currentFieldNode = currentFieldNode.nextNode
         
         return rowData
     
     def splitFields(self, lineContent: str) -> LinkedList:
-        fieldList = LinkedList()
+        fieldList = createSequence(self.sequenceType)
         currentField = ""
         
         for char in lineContent:
@@ -213,32 +219,50 @@ class FileReader:
     def getErrorLog(self) -> LinkedList:
         return self.errorLog
 
-    def processAsMatrix(self) -> Matrix:
-        if self.processedData.isEmpty():
-            return Matrix(0, 0)
-        
-        rows = self.totalRows
-        cols = self.totalColumns
-        
-        decimal_data = LinkedList()
-        current_row = self.processedData.headNode
-        
-        while current_row:
-            row_data = current_row.elementData
-            decimal_row = LinkedList()
-            current_cell = row_data.headNode
+    def iterateDecimalRows(self, dtype: str = 'float64'):
+        for row_data in self.processedData:
+            decimal_row = createFloatSequence(self.sequenceType, dtype)
             
-            while current_cell:
-                num_obj = current_cell.elementData
+            for num_obj in row_data:
                 try:
                     decimal_value = num_obj.convertToFloat()
                     decimal_row.addElementAtEnd(decimal_value)
                 except Exception as e:
                     self.logError(0, str(num_obj), f"Error conversion decimal: {str(e)}")
                     decimal_row.addElementAtEnd(0.0)
-                current_cell = current_cell.nextNode
             
-            decimal_data.addElementAtEnd(decimal_row)
-            current_row = current_row.nextNode
+            yield decimal_row
+
+    def calculateDensity(self) -> float:
+        totalCells = self.totalRows * self.totalColumns
+        if totalCells == 0:
+            return 0.0
+        
+        nonZeroCount = 0
+        for row_data in self.processedData:
+            for num_obj in row_data:
+                try:
+                    if num_obj.convertToFloat() != 0.0:
+                        nonZeroCount += 1
+                except Exception:
+                    continue
+        return nonZeroCount / totalCells
+
+    def processAsMatrix(self, backingFilePath: str = None, dtype: str = 'float64') -> Matrix:
+        if self.processedData.isEmpty():
+            return Matrix(0, 0, dtype=dtype)
+        
+        if backingFilePath is not None:
+            matrix = Matrix.memory_mapped(self.totalRows, self.totalColumns, backingFilePath,
+                                          self.iterateDecimalRows(dtype), dtype=dtype)
+        else:
+            matrix = Matrix(self.totalRows, self.totalColumns, self.iterateDecimalRows(dtype), dtype=dtype)
+        
+        matrix.structure = detect_structure(matrix)
+        return matrix
+
+    def processAsSparseMatrix(self, dtype: str = 'float64') -> SparseMatrix:
+        if self.processedData.isEmpty():
+            return SparseMatrix.from_rows(0, 0, [], dtype)
         
-        return Matrix(rows, cols, decimal_data)
\ No newline at end of file
+        return SparseMatrix.from_rows(self.totalRows, self.totalColumns, self.iterateDecimalRows(dtype), dtype)
\ No newline at end of file
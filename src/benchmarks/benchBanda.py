@@ -0,0 +1,38 @@
+import random
+import sys
+import time
+from algebra.matrix import Matrix
+from algebra.estructuraMatriz import detect_structure
+from algebra.solucionadorLineal import LinearSystemSolver
+
+def buildBandedSystem(size: int, bandwidth: int, seed: int = 7) -> Matrix:
+    generator = random.Random(seed)
+    system = Matrix(size, size + 1)
+    for i in range(size):
+        rowSum = 0.0
+        for j in range(max(0, i - bandwidth), min(size, i + bandwidth + 1)):
+            value = generator.uniform(-1.0, 1.0)
+            system.set(i, j, value)
+            rowSum += abs(value)
+        system.set(i, i, rowSum + 1.0)
+        system.set(i, size, generator.uniform(-10.0, 10.0))
+    return system
+
+def measureSolver(solverName: str, solverFunction, system: Matrix, bandwidth: int) -> float:
+    startTime = time.perf_counter()
+    solverFunction(system)
+    elapsed = time.perf_counter() - startTime
+    print(f"{solverName:>28} n={system.rows:<5} b={bandwidth:<3} {elapsed:>9.3f} s")
+    return elapsed
+
+def main():
+    sizes = [int(argument) for argument in sys.argv[1:]] or [100, 250, 500]
+    for size in sizes:
+        for bandwidth in (1, 4):
+            system = buildBandedSystem(size, bandwidth)
+            structure = detect_structure(system)
+            measureSolver("banded_solve", lambda matrix: LinearSystemSolver.banded_solve(matrix, structure), system, bandwidth)
+            measureSolver("gaussian_elimination", LinearSystemSolver.gaussian_elimination, system.snapshot(), bandwidth)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+import os
+import sys
+import time
+from algebra.solucionadorLineal import LinearSystemSolver
+from benchmarks.benchSolucionador import buildDiagonallyDominantSystem
+
+def measureElimination(system, workers: int) -> float:
+    startTime = time.perf_counter()
+    if workers > 1:
+        LinearSystemSolver.parallel_gaussian_elimination(system, workers)
+    else:
+        LinearSystemSolver.gaussian_elimination(system)
+    return time.perf_counter() - startTime
+
+def main():
+    sizes = [int(argument) for argument in sys.argv[1:]] or [250, 500, 1000]
+    workerCount = os.cpu_count() or 1
+    print(f"Procesos disponibles: {workerCount}")
+    
+    workerOptions = sorted({1, 2, 4, workerCount})
+    for size in sizes:
+        baseline = None
+        for workers in workerOptions:
+            elapsed = measureElimination(buildDiagonallyDominantSystem(size), workers)
+            baseline = baseline or elapsed
+            print(f"{'workers=' + str(workers):>14} n={size:<5} {elapsed:>9.3f} s  x{baseline / elapsed:.2f}")
+
+if __name__ == "__main__":
+    main()
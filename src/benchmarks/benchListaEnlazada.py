@@ -0,0 +1,30 @@
+import time
+from estructuras.listaEnlazada import LinkedList
+
+def measureBuild(elementCount: int) -> float:
+    startTime = time.perf_counter()
+    values = LinkedList()
+    for index in range(elementCount):
+        values.addElementAtEnd(float(index))
+    return time.perf_counter() - startTime
+
+def measureSequentialAccess(elementCount: int) -> float:
+    values = LinkedList()
+    for index in range(elementCount):
+        values.addElementAtEnd(float(index))
+    
+    startTime = time.perf_counter()
+    for index in range(elementCount):
+        values.setElementAtIndex(index, values.getElementAtIndex(index) * 2.0)
+    return time.perf_counter() - startTime
+
+def main():
+    print(f"{'elementos':>10} {'construccion (s)':>18} {'us/elem':>9} {'acceso (s)':>12} {'us/elem':>9}")
+    for elementCount in [1000, 10000, 100000]:
+        buildTime = measureBuild(elementCount)
+        accessTime = measureSequentialAccess(elementCount)
+        print(f"{elementCount:>10} {buildTime:>18.4f} {buildTime / elementCount * 1e6:>9.3f} "
+              f"{accessTime:>12.4f} {accessTime / elementCount * 1e6:>9.3f}")
+
+if __name__ == "__main__":
+    main()
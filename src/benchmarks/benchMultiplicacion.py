@@ -0,0 +1,37 @@
+import os
+import random
+import sys
+import time
+from algebra.matrix import Matrix
+from algebra.multiplicacion import MatrixMultiplier
+
+def buildRandomMatrix(rows: int, cols: int, seed: int) -> Matrix:
+    generator = random.Random(seed)
+    return Matrix(rows, cols, [[generator.uniform(-1.0, 1.0) for _ in range(cols)] for _ in range(rows)])
+
+def measureMode(multiplier: MatrixMultiplier, left: Matrix, right: Matrix) -> float:
+    startTime = time.perf_counter()
+    left.multiply(right, multiplier)
+    return time.perf_counter() - startTime
+
+def main():
+    sizes = [int(argument) for argument in sys.argv[1:]] or [100, 200, 400]
+    workerCount = os.cpu_count() or 1
+    print(f"Procesos disponibles: {workerCount}")
+    
+    for size in sizes:
+        left = buildRandomMatrix(size, size, 1)
+        right = buildRandomMatrix(size, size, 2)
+        modes = [
+            ("naive", MatrixMultiplier('naive')),
+            ("blocked", MatrixMultiplier('blocked', tile_size=64)),
+            (f"parallel x{workerCount}", MatrixMultiplier('parallel', tile_size=64, workers=workerCount)),
+        ]
+        for modeName, multiplier in modes:
+            if modeName == "naive" and size > 200:
+                continue
+            elapsed = measureMode(multiplier, left, right)
+            print(f"{modeName:>14} n={size:<5} {elapsed:>9.3f} s")
+
+if __name__ == "__main__":
+    main()
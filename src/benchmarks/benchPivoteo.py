@@ -0,0 +1,21 @@
+import sys
+import time
+from algebra.solucionadorLineal import LinearSystemSolver
+from benchmarks.benchSolucionador import buildDiagonallyDominantSystem
+
+def measurePivoting(pivoting: str, size: int) -> float:
+    system = buildDiagonallyDominantSystem(size)
+    startTime = time.perf_counter()
+    LinearSystemSolver.gaussian_elimination(system, pivoting=pivoting)
+    return time.perf_counter() - startTime
+
+def main():
+    sizes = [int(argument) for argument in sys.argv[1:]] or [200, 1000]
+    for size in sizes:
+        partialTime = measurePivoting('partial', size)
+        scaledTime = measurePivoting('scaled', size)
+        print(f"n={size:<5} parcial {partialTime:>9.3f} s   escalado {scaledTime:>9.3f} s   "
+              f"razon {scaledTime / partialTime:>5.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+import random
+import sys
+import time
+from algebra.matrix import Matrix
+from algebra.solucionadorLineal import LinearSystemSolver
+
+def buildDiagonallyDominantSystem(size: int, seed: int = 7) -> Matrix:
+    generator = random.Random(seed)
+    system = Matrix(size, size + 1)
+    for i in range(size):
+        rowSum = 0.0
+        for j in range(size):
+            value = generator.uniform(-1.0, 1.0)
+            system.set(i, j, value)
+            rowSum += abs(value)
+        system.set(i, i, rowSum + 1.0)
+        system.set(i, size, generator.uniform(-10.0, 10.0))
+    return system
+
+def measureSolver(solverName: str, solverFunction, size: int) -> float:
+    system = buildDiagonallyDominantSystem(size)
+    startTime = time.perf_counter()
+    solverFunction(system)
+    elapsed = time.perf_counter() - startTime
+    print(f"{solverName:>28} n={size:<5} {elapsed:>9.3f} s")
+    return elapsed
+
+def main():
+    sizes = [int(argument) for argument in sys.argv[1:]] or [100, 250, 500]
+    for size in sizes:
+        measureSolver("gaussian_elimination", LinearSystemSolver.gaussian_elimination, size)
+        measureSolver("gauss_jordan", LinearSystemSolver.gauss_jordan, size)
+        measureSolver("mixed_precision_solve", LinearSystemSolver.mixed_precision_solve, size)
+
+if __name__ == "__main__":
+    main()
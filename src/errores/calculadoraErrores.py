@@ -24,25 +24,18 @@ class ErrorCalculator:
     @staticmethod
     def calculateSumErrorPropagation(errorValues: LinkedList) -> float:
         total = 0.0
-        current = errorValues.headNode
-        while current:
-            total += current.elementData
-            current = current.nextNode
+        for errorValue in errorValues:
+            total += errorValue
         return total
     
     @staticmethod
     def calculateProductErrorPropagation(values: LinkedList, absoluteErrors: LinkedList) -> float:
         relativeErrorSquaredSum = 0.0
-        current_val = values.headNode
-        current_err = absoluteErrors.headNode
         
         if values.getListLength() != absoluteErrors.getListLength():
             raise ValueError("Las listas de valores y errores deben tener la misma longitud")
         
-        while current_val and current_err:
-            value = current_val.elementData
-            abs_error = current_err.elementData
-            
+        for value, abs_error in zip(values, absoluteErrors):
             if value == 0:
                 if abs_error != 0:
                     relativeError = float('inf')
@@ -52,16 +45,11 @@ class ErrorCalculator:
                 relativeError = abs_error / abs(value)
             
             relativeErrorSquaredSum += relativeError ** 2
-            
-            current_val = current_val.nextNode
-            current_err = current_err.nextNode
         
         productMagnitude = 1.0
-        current = values.headNode
-        while current:
-            if current.elementData != 0:
-                productMagnitude *= abs(current.elementData)
-            current = current.nextNode
+        for value in values:
+            if value != 0:
+                productMagnitude *= abs(value)
         
         if relativeErrorSquaredSum == float('inf'):
             return float('inf')
@@ -39,6 +39,10 @@ class SingularMatrixError(Exception):
     """Excepción lanzada cuando se intenta operar con una matriz singular."""
     pass
 
+class NonPositiveDefiniteError(NumericCalculationException):
+    """La matriz no es simetrica definida positiva (pivote no positivo en Cholesky)"""
+    pass
+
 class InvalidNumericOperationError(NumericCalculationException):
     """Operacion numerica no valida para el tipo de dato o sistema numerico"""
     pass
@@ -83,4 +87,8 @@ class IndexOutOfBoundsException(ProjectBaseException):
 
 class InvalidDataTypeException(ProjectBaseException):
     """Tipo de dato incompatible con la operacion solicitada"""
+    pass
+
+class ChannelClosedException(ProjectBaseException):
+    """Operacion invalida sobre un canal cerrado o cerrado y vacio"""
     pass
\ No newline at end of file
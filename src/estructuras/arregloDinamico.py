@@ -0,0 +1,67 @@
+from array import array
+
+class DynamicArray:
+    def __init__(self):
+        self.elementBuffer = self.createBuffer()
+    
+    def createBuffer(self):
+        return []
+    
+    def validateIndex(self, positionIndex: int):
+        if positionIndex < 0 or positionIndex >= len(self.elementBuffer):
+            raise IndexError("Indice fuera de rango")
+    
+    def addElementAtEnd(self, elementData):
+        self.elementBuffer.append(elementData)
+    
+    def addElementAtPosition(self, elementData, positionIndex: int):
+        if positionIndex < 0 or positionIndex > len(self.elementBuffer):
+            raise IndexError("Indice fuera de rango")
+        self.elementBuffer.insert(positionIndex, elementData)
+    
+    def getElementAtIndex(self, positionIndex: int):
+        self.validateIndex(positionIndex)
+        return self.elementBuffer[positionIndex]
+    
+    def setElementAtIndex(self, index: int, value):
+        self.validateIndex(index)
+        self.elementBuffer[index] = value
+    
+    def removeElementAtIndex(self, positionIndex: int):
+        self.validateIndex(positionIndex)
+        return self.elementBuffer.pop(positionIndex)
+    
+    def searchElement(self, targetData):
+        for currentIndex, elementData in enumerate(self.elementBuffer):
+            if elementData == targetData:
+                return currentIndex
+        return -1
+    
+    def isEmpty(self):
+        return len(self.elementBuffer) == 0
+    
+    def getListLength(self):
+        return len(self.elementBuffer)
+    
+    def clearList(self):
+        self.elementBuffer = self.createBuffer()
+    
+    def __iter__(self):
+        return iter(self.elementBuffer)
+    
+    def toPythonList(self):
+        return list(self.elementBuffer)
+    
+    def __str__(self):
+        return "[" + ", ".join(str(elementData) for elementData in self.elementBuffer) + "]"
+
+class FloatArray(DynamicArray):
+    def createBuffer(self):
+        return array('d')
+    
+    def toPythonList(self):
+        return self.elementBuffer.tolist()
+
+class Float32Array(FloatArray):
+    def createBuffer(self):
+        return array('f')
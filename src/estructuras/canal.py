@@ -0,0 +1,67 @@
+import threading
+import time
+from estructuras.cola import Queue
+from errores.tiposErrores import ChannelClosedException
+
+class Channel:
+    def __init__(self, maxCapacity: int = 64):
+        self.channelQueue = Queue(maxCapacity)
+        self.channelLock = threading.Lock()
+        self.notEmptyCondition = threading.Condition(self.channelLock)
+        self.notFullCondition = threading.Condition(self.channelLock)
+        self.channelClosed = False
+    
+    def waitForCondition(self, condition: threading.Condition, predicate, timeout: float):
+        if not condition.wait_for(predicate, timeout):
+            raise TimeoutError("Tiempo de espera agotado en el canal")
+    
+    def sendElement(self, elementData, timeout: float = None):
+        with self.channelLock:
+            self.waitForCondition(
+                self.notFullCondition,
+                lambda: self.channelClosed or not self.channelQueue.isQueueFull(),
+                timeout
+            )
+            if self.channelClosed:
+                raise ChannelClosedException("Operacion invalida: canal cerrado")
+            self.channelQueue.addElementToQueue(elementData)
+            self.notEmptyCondition.notify()
+    
+    def receiveElement(self, timeout: float = None):
+        with self.channelLock:
+            self.waitForCondition(
+                self.notEmptyCondition,
+                lambda: self.channelClosed or not self.channelQueue.isQueueEmpty(),
+                timeout
+            )
+            if self.channelQueue.isQueueEmpty():
+                raise ChannelClosedException("Canal cerrado y vacio")
+            elementData = self.channelQueue.removeElementFromQueue()
+            self.notFullCondition.notify()
+            return elementData
+    
+    def closeChannel(self):
+        with self.channelLock:
+            self.channelClosed = True
+            self.notEmptyCondition.notify_all()
+            self.notFullCondition.notify_all()
+    
+    def isChannelClosed(self):
+        with self.channelLock:
+            return self.channelClosed
+    
+    def getChannelSize(self):
+        with self.channelLock:
+            return self.channelQueue.getQueueSize()
+    
+    def drainChannel(self, timeout: float = None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                yield self.receiveElement(remaining)
+            except ChannelClosedException:
+                return
+    
+    def __iter__(self):
+        return self.drainChannel()
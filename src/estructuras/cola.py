@@ -1,43 +1,63 @@
-from estructuras.listaEnlazada import LinkedList
-
 class Queue:
-    def __init__(self):
-        self.queueData = LinkedList()
-        self.lastNode = None
+    initialCapacity = 16
+    
+    def __init__(self, maxCapacity: int = None):
+        if maxCapacity is not None and maxCapacity <= 0:
+            raise ValueError("La capacidad maxima debe ser positiva")
+        self.maxCapacity = maxCapacity
+        bufferSize = self.initialCapacity if maxCapacity is None else min(maxCapacity, self.initialCapacity)
+        self.queueBuffer = [None] * bufferSize
+        self.firstIndex = 0
+        self.elementCount = 0
     
     def addElementToQueue(self, elementData):
-        newNode = LinkedList.Node(elementData)
-        if self.queueData.isEmpty():
-            self.queueData.head = newNode
-            self.lastNode = newNode
-        else:
-            self.lastNode.next = newNode
-            self.lastNode = newNode
-        self.queueData.length += 1
+        if self.isQueueFull():
+            raise OverflowError("Operacion invalida: cola llena")
+        if self.elementCount == len(self.queueBuffer):
+            self.growBuffer()
+        
+        lastIndex = (self.firstIndex + self.elementCount) % len(self.queueBuffer)
+        self.queueBuffer[lastIndex] = elementData
+        self.elementCount += 1
     
     def removeElementFromQueue(self):
         if self.isQueueEmpty():
             raise IndexError("Operacion invalida: cola vacia")
         
-        elementData = self.queueData.head.data
-        self.queueData.head = self.queueData.head.next
-        self.queueData.length -= 1
-        
-        if self.isQueueEmpty():
-            self.lastNode = None
-            
+        elementData = self.queueBuffer[self.firstIndex]
+        self.queueBuffer[self.firstIndex] = None
+        self.firstIndex = (self.firstIndex + 1) % len(self.queueBuffer)
+        self.elementCount -= 1
         return elementData
     
+    def growBuffer(self):
+        newSize = len(self.queueBuffer) * 2
+        if self.maxCapacity is not None:
+            newSize = min(newSize, self.maxCapacity)
+        
+        newBuffer = [None] * newSize
+        for offset in range(self.elementCount):
+            newBuffer[offset] = self.queueBuffer[(self.firstIndex + offset) % len(self.queueBuffer)]
+        self.queueBuffer = newBuffer
+        self.firstIndex = 0
+    
     def isQueueEmpty(self):
-        return self.queueData.length == 0
+        return self.elementCount == 0
+    
+    def isQueueFull(self):
+        return self.maxCapacity is not None and self.elementCount >= self.maxCapacity
     
     def getFirstElementInQueue(self):
-        return self.queueData.head.data if not self.isQueueEmpty() else None
+        return self.queueBuffer[self.firstIndex] if not self.isQueueEmpty() else None
     
     def getQueueSize(self):
-        return self.queueData.length
+        return self.elementCount
     
     def clearQueue(self):
-        self.queueData.head = None
-        self.lastNode = None
-        self.queueData.length = 0
\ No newline at end of file
+        self.queueBuffer = [None] * len(self.queueBuffer)
+        self.firstIndex = 0
+        self.elementCount = 0
+    
+    def __iter__(self):
+        for offset in range(self.elementCount):
+            yield self.queueBuffer[(self.firstIndex + offset) % len(self.queueBuffer)]
@@ -6,7 +6,29 @@ class Node:
 class LinkedList:
     def __init__(self):
         self.headNode = None
+        self.tailNode = None
         self.listLength = 0
+        self.resetCursor()
+    
+    def resetCursor(self):
+        self.cursorNode = None
+        self.cursorIndex = -1
+    
+    def getNodeAtIndex(self, positionIndex: int) -> Node:
+        if positionIndex == self.listLength - 1:
+            currentNode = self.tailNode
+        elif self.cursorNode is not None and positionIndex >= self.cursorIndex:
+            currentNode = self.cursorNode
+            for _ in range(positionIndex - self.cursorIndex):
+                currentNode = currentNode.nextNode
+        else:
+            currentNode = self.headNode
+            for _ in range(positionIndex):
+                currentNode = currentNode.nextNode
+        
+        self.cursorNode = currentNode
+        self.cursorIndex = positionIndex
+        return currentNode
     
     def addElementAtEnd(self, elementData):
         newNode = Node(elementData)
@@ -14,10 +36,8 @@ class LinkedList:
         if self.headNode is None:
             self.headNode = newNode
         else:
-            currentNode = self.headNode
-            while currentNode.nextNode:
-                currentNode = currentNode.nextNode
-            currentNode.nextNode = newNode
+            self.tailNode.nextNode = newNode
+        self.tailNode = newNode
             
         self.listLength += 1
     
@@ -31,23 +51,21 @@ class LinkedList:
             newNode.nextNode = self.headNode
             self.headNode = newNode
         else:
-            currentNode = self.headNode
-            for _ in range(positionIndex - 1):
-                currentNode = currentNode.nextNode
+            currentNode = self.getNodeAtIndex(positionIndex - 1)
             newNode.nextNode = currentNode.nextNode
             currentNode.nextNode = newNode
+        
+        if newNode.nextNode is None:
+            self.tailNode = newNode
             
         self.listLength += 1
+        self.resetCursor()
     
     def getElementAtIndex(self, positionIndex: int):
         if positionIndex < 0 or positionIndex >= self.listLength:
             raise IndexError("Indice fuera de rango")
             
-        currentNode = self.headNode
-        for _ in range(positionIndex):
-            currentNode = currentNode.nextNode
-            
-        return currentNode.elementData
+        return self.getNodeAtIndex(positionIndex).elementData
     
     def removeElementAtIndex(self, positionIndex: int):
         if positionIndex < 0 or positionIndex >= self.listLength:
@@ -56,15 +74,18 @@ class LinkedList:
         if positionIndex == 0:
             removedData = self.headNode.elementData
             self.headNode = self.headNode.nextNode
+            if self.headNode is None:
+                self.tailNode = None
         else:
-            previousNode = self.headNode
-            for _ in range(positionIndex - 1):
-                previousNode = previousNode.nextNode
+            previousNode = self.getNodeAtIndex(positionIndex - 1)
                 
             removedData = previousNode.nextNode.elementData
             previousNode.nextNode = previousNode.nextNode.nextNode
+            if previousNode.nextNode is None:
+                self.tailNode = previousNode
             
         self.listLength -= 1
+        self.resetCursor()
         return removedData
     
     def searchElement(self, targetData):
@@ -87,7 +108,9 @@ class LinkedList:
     
     def clearList(self):
         self.headNode = None
+        self.tailNode = None
         self.listLength = 0
+        self.resetCursor()
     
     def __iter__(self):
         currentNode = self.headNode
@@ -98,10 +121,7 @@ class LinkedList:
     def setElementAtIndex(self, index: int, value):
         if index < 0 or index >= self.listLength:
             raise IndexError("Índice fuera de rango")
-        current = self.headNode
-        for _ in range(index):
-            current = current.nextNode
-        current.elementData = value
+        self.getNodeAtIndex(index).elementData = value
 
     def toPythonList(self):
         result = []
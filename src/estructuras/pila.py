@@ -1,45 +1,56 @@
-from estructuras.listaEnlazada import LinkedList
-
 class Stack:
-    def __init__(self):
-        self.stackData = LinkedList()
+    initialCapacity = 16
+    
+    def __init__(self, maxCapacity: int = None):
+        if maxCapacity is not None and maxCapacity <= 0:
+            raise ValueError("La capacidad maxima debe ser positiva")
+        self.maxCapacity = maxCapacity
+        bufferSize = self.initialCapacity if maxCapacity is None else min(maxCapacity, self.initialCapacity)
+        self.stackBuffer = [None] * bufferSize
+        self.elementCount = 0
     
     def addElementToStack(self, elementData):
+        if self.isStackFull():
+            raise OverflowError("Operacion invalida: pila llena")
+        if self.elementCount == len(self.stackBuffer):
+            self.growBuffer()
         
-        newNode = LinkedList.Node(elementData)
-        newNode.next = self.stackData.headNode
-        self.stackData.headNode = newNode
-        self.stackData.listLength += 1
+        self.stackBuffer[self.elementCount] = elementData
+        self.elementCount += 1
     
     def removeElementFromStack(self):
         if self.isStackEmpty():
             raise IndexError("Operacion invalida: pila vacia")
         
-        elementData = self.stackData.headNode.data
-        self.stackData.headNode = self.stackData.headNode.next
-        self.stackData.listLength -= 1
-        
+        self.elementCount -= 1
+        elementData = self.stackBuffer[self.elementCount]
+        self.stackBuffer[self.elementCount] = None
         return elementData
     
+    def growBuffer(self):
+        newSize = len(self.stackBuffer) * 2
+        if self.maxCapacity is not None:
+            newSize = min(newSize, self.maxCapacity)
+        self.stackBuffer.extend([None] * (newSize - len(self.stackBuffer)))
+    
     def getTopElementFromStack(self):
-        return self.stackData.headNode.data if not self.isStackEmpty() else None
+        return self.stackBuffer[self.elementCount - 1] if not self.isStackEmpty() else None
     
     def isStackEmpty(self):
-        return self.stackData.listLength == 0
+        return self.elementCount == 0
+    
+    def isStackFull(self):
+        return self.maxCapacity is not None and self.elementCount >= self.maxCapacity
     
     def getStackSize(self):
-        return self.stackData.listLength
+        return self.elementCount
     
     def clearStack(self):
-        self.stackData.headNode = None
-        self.stackData.listLength = 0
+        self.stackBuffer = [None] * len(self.stackBuffer)
+        self.elementCount = 0
     
     def __str__(self):
-        elements = LinkedList()
-        currentNode = self.stackData.headNode
-        
-        while currentNode:
-            elements.append(str(currentNode.data))
-            currentNode = currentNode.next
-        
-        return "Stack: [" + " <- ".join(elements) if elements.length > 0 else "Pila Vacia"
+        if self.isStackEmpty():
+            return "Pila Vacia"
+        elements = [str(self.stackBuffer[index]) for index in range(self.elementCount - 1, -1, -1)]
+        return "Stack: [" + " <- ".join(elements) + "]"
@@ -0,0 +1,32 @@
+from estructuras.listaEnlazada import LinkedList
+from estructuras.arregloDinamico import DynamicArray, FloatArray, Float32Array
+
+sequenceRegistry = {}
+defaultSequenceType = "LinkedList"
+
+def registerSequenceType(typeName, sequenceClass, floatSequenceClass=None, compactFloatSequenceClass=None):
+    floatSequenceClass = floatSequenceClass or sequenceClass
+    sequenceRegistry[typeName] = (sequenceClass, floatSequenceClass, compactFloatSequenceClass or floatSequenceClass)
+
+def setDefaultSequenceType(typeName):
+    global defaultSequenceType
+    if typeName not in sequenceRegistry:
+        raise ValueError(f"Tipo de secuencia no registrado: {typeName}")
+    defaultSequenceType = typeName
+
+def resolveSequenceClasses(typeName=None):
+    selectedType = typeName or defaultSequenceType
+    if selectedType not in sequenceRegistry:
+        raise ValueError(f"Tipo de secuencia no registrado: {selectedType}")
+    return sequenceRegistry[selectedType]
+
+def createSequence(typeName=None):
+    return resolveSequenceClasses(typeName)[0]()
+
+def createFloatSequence(typeName=None, dtype='float64'):
+    if dtype not in ('float64', 'float32'):
+        raise ValueError(f"Tipo de dato no soportado: {dtype}")
+    return resolveSequenceClasses(typeName)[2 if dtype == 'float32' else 1]()
+
+registerSequenceType("LinkedList", LinkedList)
+registerSequenceType("DynamicArray", DynamicArray, FloatArray, Float32Array)
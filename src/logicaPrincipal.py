@@ -1,8 +1,12 @@
 import os
 import time
+import tempfile
 import random
+from concurrent.futures import ThreadPoolExecutor, Future
 from datetime import datetime
 from estructuras.listaEnlazada import LinkedList
+from estructuras.secuencias import createSequence, createFloatSequence
+from estructuras.canal import Channel
 from archivos.lectorArchivos import FileReader
 from utilidades.Generador import FileGenerator
 from errores.calculadoraErrores import ErrorCalculator
@@ -12,19 +16,33 @@ from errores.tiposErrores import (
     FileNotFoundException,
     IOException,
     MatrixDimensionsError,
-    SingularMatrixError
+    SingularMatrixError,
+    NonPositiveDefiniteError
 )
 from core.tiposUtilidades import isTypeInstance
 from algebra.matrix import Matrix
+from algebra.matrizDispersa import SparseMatrix
+from algebra.formatoMatriz import MatrixFormatter
+from algebra.estructuraMatriz import MatrixStructure, detect_structure
 from algebra.solucionadorLineal import LinearSystemSolver
 from errores.errorLogger import ErrorLogger
 
 class LogicaPrincipal:
-    def __init__(self, dataDirectoryPath: str, outputDirectoryPath: str, logsDirectoryPath: str):
+    def __init__(self, dataDirectoryPath: str, outputDirectoryPath: str, logsDirectoryPath: str,
+                 sequenceType: str = None, channelCapacity: int = 256, sparseDensityThreshold: float = 0.3,
+                 outOfCoreCellThreshold: int = None, matrixFormatter: MatrixFormatter = None,
+                 matrixDtype: str = 'float64', mixedPrecisionSolve: bool = None):
         self.dataDirectoryPath = dataDirectoryPath
         self.outputDirectoryPath = outputDirectoryPath
         self.logsDirectoryPath = logsDirectoryPath
-        self.fileProcessor = FileReader()
+        self.sequenceType = sequenceType
+        self.channelCapacity = channelCapacity
+        self.sparseDensityThreshold = sparseDensityThreshold
+        self.outOfCoreCellThreshold = outOfCoreCellThreshold
+        self.matrixFormatter = matrixFormatter or MatrixFormatter()
+        self.matrixDtype = matrixDtype
+        self.mixedPrecisionSolve = matrixDtype == 'float32' if mixedPrecisionSolve is None else mixedPrecisionSolve
+        self.fileProcessor = FileReader(sequenceType)
         self.fileGenerator = FileGenerator(self.outputDirectoryPath)
 
     def setupProcessingEnvironment(self):
@@ -37,7 +55,7 @@ class LogicaPrincipal:
                     raise OSError(f"Error al crear directorio {directory}: {str(osError)}")
 
     def getProcessableFiles(self) -> LinkedList:
-        fileList = LinkedList()
+        fileList = createSequence(self.sequenceType)
         try:
             if os.path.exists(self.dataDirectoryPath):
                 for fileName in os.listdir(self.dataDirectoryPath):
@@ -49,16 +67,14 @@ class LogicaPrincipal:
         return fileList
 
     def processFileCollection(self, fileList: LinkedList):
-        currentNode = fileList.headNode
-        while currentNode:
+        for filePath in fileList:
             try:
-                self.processSingleInputFile(currentNode.elementData)
+                self.processSingleInputFile(filePath)
             except FileProcessingException as fileError:
                 print(f"Error procesando archivo: {str(fileError)}")
             except Exception as unexpectedError:
                 ErrorLogger.log("UnexpectedProcessingError", f"Error inesperado: {str(unexpectedError)}")
                 print(f"Error inesperado: {str(unexpectedError)}")
-            currentNode = currentNode.nextNode
 
     def processSingleInputFile(self, filePath: str):
         try:
@@ -66,22 +82,30 @@ class LogicaPrincipal:
             fileName = os.path.basename(filePath)
             
             self.printProcessingHeader(fileName)
-
-            processedData = self.fileProcessor.processInputFile(filePath)
-            rowCount, columnCount = self.fileProcessor.getDimensions()
-            print(f"Archivo procesado: {rowCount} filas x {columnCount} columnas")
-            
-            analysisResults = LinkedList()
-            self.calculateNumericalAnalysis(processedData, analysisResults)
-            
-            self.calculateErrorMetrics(processedData, analysisResults)
-            
-            matrix = self.fileProcessor.processAsMatrix()
-            analysisResults.addElementAtEnd("\n=== Operaciones Matriciales ===")
-            self.performMatrixOperations(matrix, analysisResults)
             
             baseName = fileName.split('_')[0]
-            outputFilePath = self.fileGenerator.generateOutputFile(baseName, analysisResults)
+            rowChannel = Channel(self.channelCapacity)
+            resultsChannel = Channel(self.channelCapacity)
+            
+            with ThreadPoolExecutor(max_workers=2) as stageExecutor:
+                readerFuture = stageExecutor.submit(self.runReaderStage, filePath, rowChannel)
+                writerFuture = stageExecutor.submit(
+                    self.fileGenerator.generateOutputFileFromChannel, baseName, resultsChannel
+                )
+                try:
+                    self.runAnalysisStage(readerFuture, rowChannel, resultsChannel)
+                except Exception as analysisError:
+                    resultsChannel.closeChannel()
+                    writerError = writerFuture.exception()
+                    if writerError is not None:
+                        raise writerError from analysisError
+                    self.discardPartialOutput(writerFuture)
+                    raise
+                finally:
+                    rowChannel.closeChannel()
+                    resultsChannel.closeChannel()
+                
+                outputFilePath = writerFuture.result()
             
             self.displayProcessingStatistics(startTime, outputFilePath)
             
@@ -91,27 +115,84 @@ class LogicaPrincipal:
             ErrorLogger.log("FileProcessingError", f"Error procesando {filePath}: {str(processingError)}")
             raise FileProcessingException(f"Error inesperado: {str(processingError)}")
 
+    def runReaderStage(self, filePath: str, rowChannel: Channel) -> LinkedList:
+        try:
+            return self.fileProcessor.processInputFile(filePath, rowChannel)
+        finally:
+            rowChannel.closeChannel()
+
+    def runAnalysisStage(self, readerFuture: Future, rowChannel: Channel, resultsChannel: Channel):
+        rowNumber = 1
+        for rowData in rowChannel:
+            self.calculateRowAnalysis(rowNumber, rowData, resultsChannel)
+            rowNumber += 1
+        
+        processedData = readerFuture.result()
+        rowCount, columnCount = self.fileProcessor.getDimensions()
+        print(f"Archivo procesado: {rowCount} filas x {columnCount} columnas")
+        
+        analysisResults = createSequence(self.sequenceType)
+        self.calculateErrorMetrics(processedData, analysisResults)
+        
+        sparseMatrix = self.loadUnstructuredSparseSystem(rowCount, columnCount)
+        if sparseMatrix is not None:
+            self.performSparseMatrixOperations(sparseMatrix, analysisResults)
+        else:
+            self.performDenseMatrixAnalysis(rowCount * columnCount, analysisResults)
+        
+        for resultLine in analysisResults:
+            resultsChannel.sendElement(resultLine)
+
+    def loadUnstructuredSparseSystem(self, rowCount: int, columnCount: int) -> SparseMatrix:
+        if columnCount != rowCount + 1 or self.fileProcessor.calculateDensity() > self.sparseDensityThreshold:
+            return None
+        
+        sparseMatrix = self.fileProcessor.processAsSparseMatrix(self.matrixDtype)
+        structure = detect_structure(sparseMatrix)
+        if structure.is_banded() or structure.symmetric:
+            return None
+        return sparseMatrix
+
+    def performDenseMatrixAnalysis(self, cellCount: int, analysisResults: LinkedList):
+        backingFilePath = self.getMatrixBackingFilePath(cellCount)
+        matrix = self.fileProcessor.processAsMatrix(backingFilePath, self.matrixDtype)
+        try:
+            analysisResults.addElementAtEnd("\n=== Operaciones Matriciales ===")
+            analysisResults.addElementAtEnd(f"Precision de almacenamiento: {matrix.dtype}")
+            self.performMatrixOperations(matrix, analysisResults)
+        finally:
+            matrix.close()
+            if backingFilePath is not None and os.path.exists(backingFilePath):
+                os.remove(backingFilePath)
+
+    def getMatrixBackingFilePath(self, cellCount: int) -> str:
+        if self.outOfCoreCellThreshold is None or cellCount <= self.outOfCoreCellThreshold:
+            return None
+        
+        suffix = ".f32" if self.matrixDtype == 'float32' else ".f64"
+        descriptor, backingFilePath = tempfile.mkstemp(suffix=suffix, dir=self.logsDirectoryPath)
+        os.close(descriptor)
+        return backingFilePath
+
+    def discardPartialOutput(self, writerFuture: Future):
+        try:
+            partialPath = writerFuture.result()
+        except Exception:
+            return
+        if partialPath and os.path.exists(partialPath):
+            os.remove(partialPath)
+
     def printProcessingHeader(self, fileName: str):
         separator = "=" * 50
         print(f"\n{separator}")
         print(f"Procesando archivo: {fileName}")
         print(f"{separator}")
 
-    def calculateNumericalAnalysis(self, processedData: LinkedList, resultContainer: LinkedList):
-        currentRowNode = processedData.headNode
-        rowNumber = 1
-        while currentRowNode:
-            rowData = currentRowNode.elementData
-            currentCellNode = rowData.headNode
-            columnNumber = 1
-            while currentCellNode:
-                numberObject = currentCellNode.elementData
-                resultLine = self.formatAnalysisResult(rowNumber, columnNumber, numberObject)
-                resultContainer.addElementAtEnd(resultLine)
-                currentCellNode = currentCellNode.nextNode
-                columnNumber += 1
-            currentRowNode = currentRowNode.nextNode
-            rowNumber += 1
+    def calculateRowAnalysis(self, rowNumber: int, rowData: LinkedList, resultsChannel: Channel):
+        columnNumber = 1
+        for numberObject in rowData:
+            resultsChannel.sendElement(self.formatAnalysisResult(rowNumber, columnNumber, numberObject))
+            columnNumber += 1
 
     def formatAnalysisResult(self, rowIndex: int, columnIndex: int, numberObject) -> str:
         try:
@@ -142,30 +223,23 @@ class LogicaPrincipal:
         if processedData.isEmpty() or processedData.getListLength() < 2:
             return
         
-        allValues = LinkedList()
-        currentRow = processedData.headNode
-        while currentRow:
-            row = currentRow.elementData
-            if not row.isEmpty():
-                currentCell = row.headNode
-                while currentCell:
-                    try:
-                        float_val = currentCell.elementData.convertToFloat()
-                        allValues.addElementAtEnd(float_val)
-                    except Exception as e:
-                        print(f"Advertencia: valor no convertible a float - {str(e)}")
-                    currentCell = currentCell.nextNode
-            currentRow = currentRow.nextNode
+        allValues = createFloatSequence(self.sequenceType)
+        for row in processedData:
+            for numberObject in row:
+                try:
+                    float_val = numberObject.convertToFloat()
+                    allValues.addElementAtEnd(float_val)
+                except Exception as e:
+                    print(f"Advertencia: valor no convertible a float - {str(e)}")
         
         if allValues.getListLength() < 2:
             return
         
         resultContainer.addElementAtEnd("\n=== Resultados del analisis de errores ===")
         
-        current = allValues.headNode
-        while current and current.nextNode:
-            exact = current.elementData
-            approx = current.nextNode.elementData
+        for pairIndex in range(0, allValues.getListLength() - 1, 2):
+            exact = allValues.getElementAtIndex(pairIndex)
+            approx = allValues.getElementAtIndex(pairIndex + 1)
             
             if exact == 0 and approx == 0:
                 resultLine = (
@@ -173,7 +247,6 @@ class LogicaPrincipal:
                     f" - Ambos valores son cero: calculos omitidos"
                 )
                 resultContainer.addElementAtEnd(resultLine)
-                current = current.nextNode.nextNode if current.nextNode else None
                 continue
             
             try:
@@ -182,16 +255,16 @@ class LogicaPrincipal:
                 roundError = ErrorCalculator.calculateRoundingError(4)
                 truncError = ErrorCalculator.calculateTruncationError(4)
                 
-                errorValues = LinkedList()
+                errorValues = createFloatSequence(self.sequenceType)
                 errorValues.addElementAtEnd(absError)
                 errorValues.addElementAtEnd(relError)
                 sumPropError = ErrorCalculator.calculateSumErrorPropagation(errorValues)
                 
-                valuesList = LinkedList()
+                valuesList = createFloatSequence(self.sequenceType)
                 valuesList.addElementAtEnd(exact)
                 valuesList.addElementAtEnd(approx)
                 
-                absErrorsList = LinkedList()
+                absErrorsList = createFloatSequence(self.sequenceType)
                 absErrorsList.addElementAtEnd(absError)
                 absErrorsList.addElementAtEnd(absError)
                 
@@ -219,56 +292,42 @@ class LogicaPrincipal:
                     f"{str(e)}"
                 )
                 resultContainer.addElementAtEnd(errorMsg)
-            
-            current = current.nextNode.nextNode if current.nextNode else None
 
     def performMatrixOperations(self, matrix: Matrix, resultContainer: LinkedList):
         try:
-            resultContainer.addElementAtEnd("\nOperaciones elementales de matrices:")
-            
-            try:
-                # As per the context, Matrix class does not have transpose or scalar_multiply methods.
-                # These calls will raise AttributeError.
-                # If these methods were implemented, the code would look like this:
-                # transpose = matrix.transpose()
-                # resultContainer.addElementAtEnd(f"Transpuesta:\n{transpose}")
-                resultContainer.addElementAtEnd(f"Error en transpuesta: 'Matrix' object has no attribute 'transpose'")
-            except Exception as e:
-                ErrorLogger.log("MatrixTransposeError", f"Error en transpuesta: {str(e)}")
-                resultContainer.addElementAtEnd(f"Error en transpuesta: {str(e)}")
-            
-            try:
-                # As per the context, Matrix class does not have transpose or scalar_multiply methods.
-                # These calls will raise AttributeError.
-                # If these methods were implemented, the code would look like this:
-                # scaled = matrix.scalar_multiply(2.5)
-                # resultContainer.addElementAtEnd(f"\nMatriz escalada (2.5x):\n{scaled}")
-                resultContainer.addElementAtEnd(f"Error en escalado: 'Matrix' object has no attribute 'scalar_multiply'")
-            except Exception as e:
-                ErrorLogger.log("MatrixScaleError", f"Error en escalado: {str(e)}")
-                resultContainer.addElementAtEnd(f"Error en escalado: {str(e)}")
+            if matrix.is_out_of_core():
+                resultContainer.addElementAtEnd(
+                    f"\nMatriz en disco ({matrix.rows}x{matrix.cols}): se omiten transpuesta, escalado "
+                    f"y propiedades para no cargarla en memoria"
+                )
+            else:
+                self.performElementaryOperations(matrix, resultContainer)
+                self.performMatrixProperties(matrix, resultContainer)
             
-            if matrix.is_square() and matrix.cols == matrix.rows + 1:
+            if matrix.cols == matrix.rows + 1:
                 resultContainer.addElementAtEnd("\n=== Resolucion de Sistemas Lineales ===")
                 
-                try:
-                    solution_gj = LinearSystemSolver.gauss_jordan(matrix)
-                    resultContainer.addElementAtEnd("\nSolución (Gauss-Jordan):")
-                    for i in range(solution_gj.getListLength()):
-                        resultContainer.addElementAtEnd(f"x{i} = {solution_gj.getElementAtIndex(i):.6f}")
-                except (SingularMatrixError, MatrixDimensionsError) as e:
-                    ErrorLogger.log("GaussJordanError", f"Error Gauss-Jordan: {str(e)}")
-                    resultContainer.addElementAtEnd(f"Error en Gauss-Jordan: {str(e)}")
+                if matrix.is_out_of_core():
+                    self.performOutOfCoreSolve(matrix, resultContainer)
+                    return
                 
-                for pivoting_type in ['partial', 'scaled', 'complete']:
-                    try:
-                        solution_ge = LinearSystemSolver.gaussian_elimination(matrix, pivoting=pivoting_type)
-                        resultContainer.addElementAtEnd(f"\nSolución (Elim. Gaussiana - pivoteo {pivoting_type}):")
-                        for i in range(solution_ge.getListLength()):
-                            resultContainer.addElementAtEnd(f"x{i} = {solution_ge.getElementAtIndex(i):.6f}")
-                    except (SingularMatrixError, MatrixDimensionsError) as e:
-                        ErrorLogger.log(f"GaussianElimError_{pivoting_type}", f"Error Elim. Gaussiana ({pivoting_type}): {str(e)}")
-                        resultContainer.addElementAtEnd(f"Error en Elim. Gaussiana ({pivoting_type}): {str(e)}")
+                structure = matrix.structure or detect_structure(matrix)
+                solved = False
+                if structure.is_banded():
+                    self.performBandedSolve(matrix, structure, resultContainer)
+                    solved = True
+                elif structure.symmetric:
+                    solved = self.performCholeskySolve(matrix, resultContainer)
+                
+                if not solved:
+                    self.performAdaptiveSolve(matrix, resultContainer)
+                    if self.mixedPrecisionSolve:
+                        self.performMixedPrecisionSolve(matrix, resultContainer)
+                
+                self.performIterativeSolve(matrix, resultContainer)
+            elif matrix.rows > 0 and matrix.cols > matrix.rows + 1:
+                resultContainer.addElementAtEnd("\n=== Resolucion de Sistemas Lineales ===")
+                self.performMultipleRightHandSideSolve(matrix, resultContainer)
             else:
                 resultContainer.addElementAtEnd("\nEl archivo no contiene un sistema de ecuaciones valido")
         
@@ -276,6 +335,148 @@ class LogicaPrincipal:
             ErrorLogger.log("MatrixOperationError", f"Error general en operaciones matriciales: {str(e)}")
             resultContainer.addElementAtEnd(f"Error en operaciones matriciales: {str(e)}")
 
+    def performSparseMatrixOperations(self, sparseMatrix: SparseMatrix, resultContainer: LinkedList):
+        resultContainer.addElementAtEnd("\n=== Operaciones Matriciales ===")
+        resultContainer.addElementAtEnd(f"Precision de almacenamiento: {sparseMatrix.dtype}")
+        resultContainer.addElementAtEnd(
+            f"\n{sparseMatrix} sin estructura en banda ni simetrica: "
+            f"se omiten transpuesta, escalado y propiedades densas"
+        )
+        resultContainer.addElementAtEnd("\n=== Resolucion de Sistemas Lineales ===")
+        self.performSparseSolve(sparseMatrix, resultContainer)
+
+    def performElementaryOperations(self, matrix: Matrix, resultContainer: LinkedList):
+        resultContainer.addElementAtEnd("\nOperaciones elementales de matrices:")
+        
+        try:
+            transpose = matrix.transpose()
+            resultContainer.addElementAtEnd(f"Transpuesta:\n{self.matrixFormatter.to_string(transpose)}")
+        except Exception as e:
+            ErrorLogger.log("MatrixTransposeError", f"Error en transpuesta: {str(e)}")
+            resultContainer.addElementAtEnd(f"Error en transpuesta: {str(e)}")
+        
+        try:
+            scaled = matrix.scalar_multiply(2.5)
+            resultContainer.addElementAtEnd(f"\nMatriz escalada (2.5x):\n{self.matrixFormatter.to_string(scaled)}")
+        except Exception as e:
+            ErrorLogger.log("MatrixScaleError", f"Error en escalado: {str(e)}")
+            resultContainer.addElementAtEnd(f"Error en escalado: {str(e)}")
+
+    def performMatrixProperties(self, matrix: Matrix, resultContainer: LinkedList):
+        try:
+            resultContainer.addElementAtEnd(f"\nRango de la matriz: {matrix.rank()}")
+            if matrix.cols < matrix.rows or (matrix.rows == 0 and matrix.cols > 0):
+                return
+            
+            decomposition = matrix.decomposition()
+            if not matrix.is_square():
+                resultContainer.addElementAtEnd(f"Rango de la matriz de coeficientes: {decomposition.coefficient_rank}")
+            resultContainer.addElementAtEnd(f"Determinante: {decomposition.determinant():.6f}")
+            if decomposition.coefficient_rank < matrix.rows:
+                resultContainer.addElementAtEnd("Inversa: no existe (matriz singular)")
+            else:
+                resultContainer.addElementAtEnd(f"Inversa:\n{self.matrixFormatter.to_string(decomposition.inverse())}")
+        except (SingularMatrixError, MatrixDimensionsError) as e:
+            ErrorLogger.log("MatrixPropertiesError", f"Error en rango/determinante/inversa: {str(e)}")
+            resultContainer.addElementAtEnd(f"Error en rango/determinante/inversa: {str(e)}")
+
+    def performBandedSolve(self, matrix: Matrix, structure: MatrixStructure, resultContainer: LinkedList):
+        try:
+            solution = LinearSystemSolver.banded_solve(matrix, structure)
+            resultContainer.addElementAtEnd(f"\nSolución (matriz en banda - {structure}):")
+            for i in range(solution.getListLength()):
+                resultContainer.addElementAtEnd(f"x{i} = {solution.getElementAtIndex(i):.6f}")
+        except (SingularMatrixError, MatrixDimensionsError) as e:
+            ErrorLogger.log("BandedSolveError", f"Error en solucion en banda: {str(e)}")
+            resultContainer.addElementAtEnd(f"Error en solucion en banda: {str(e)}")
+
+    def performCholeskySolve(self, matrix: Matrix, resultContainer: LinkedList) -> bool:
+        try:
+            solution = LinearSystemSolver.cholesky_solve(matrix)
+        except NonPositiveDefiniteError as e:
+            resultContainer.addElementAtEnd(f"\nCholesky descartado, se usa LU: {str(e)}")
+            return False
+        
+        resultContainer.addElementAtEnd("\nSolución (Cholesky - matriz simetrica definida positiva):")
+        for i in range(solution.getListLength()):
+            resultContainer.addElementAtEnd(f"x{i} = {solution.getElementAtIndex(i):.6f}")
+        return True
+
+    def performMultipleRightHandSideSolve(self, matrix: Matrix, resultContainer: LinkedList):
+        rhs_count = matrix.cols - matrix.rows
+        try:
+            factorization = LinearSystemSolver.factorize(matrix, pivoting='partial')
+            solutions = factorization.solve_right_hand_sides(matrix)
+            resultContainer.addElementAtEnd(
+                f"\nSoluciones ({rhs_count} terminos independientes, {factorization} - columna k = sistema k):"
+            )
+            resultContainer.addElementAtEnd(self.matrixFormatter.to_string(solutions))
+        except (SingularMatrixError, MatrixDimensionsError) as e:
+            ErrorLogger.log("MultipleRhsError", f"Error con {rhs_count} terminos independientes: {str(e)}")
+            resultContainer.addElementAtEnd(f"Error con multiples terminos independientes: {str(e)}")
+
+    def performAdaptiveSolve(self, matrix: Matrix, resultContainer: LinkedList):
+        pivoting_type, condition = LinearSystemSolver.choose_pivoting(matrix)
+        resultContainer.addElementAtEnd(
+            f"\nNumero de condicion estimado (norma 1, Hager-Higham): {condition:.3e} -> pivoteo {pivoting_type}"
+        )
+        try:
+            solution_ge = LinearSystemSolver.lu_solve(matrix, pivoting=pivoting_type)
+            resultContainer.addElementAtEnd(f"\nSolución (Elim. Gaussiana - pivoteo {pivoting_type}):")
+            for i in range(solution_ge.getListLength()):
+                resultContainer.addElementAtEnd(f"x{i} = {solution_ge.getElementAtIndex(i):.6f}")
+        except (SingularMatrixError, MatrixDimensionsError) as e:
+            ErrorLogger.log(f"GaussianElimError_{pivoting_type}", f"Error Elim. Gaussiana ({pivoting_type}): {str(e)}")
+            resultContainer.addElementAtEnd(f"Error en Elim. Gaussiana ({pivoting_type}): {str(e)}")
+
+    def performOutOfCoreSolve(self, matrix: Matrix, resultContainer: LinkedList):
+        try:
+            solution = LinearSystemSolver.gaussian_elimination(matrix)
+            resultContainer.addElementAtEnd("\nSolución (Elim. Gaussiana por paneles - matriz en disco, pivoteo partial):")
+            for i in range(solution.getListLength()):
+                resultContainer.addElementAtEnd(f"x{i} = {solution.getElementAtIndex(i):.6f}")
+        except (SingularMatrixError, MatrixDimensionsError) as e:
+            ErrorLogger.log("OutOfCoreSolveError", f"Error en Elim. Gaussiana por paneles: {str(e)}")
+            resultContainer.addElementAtEnd(f"Error en Elim. Gaussiana por paneles: {str(e)}")
+
+    def performMixedPrecisionSolve(self, matrix: Matrix, resultContainer: LinkedList):
+        try:
+            result = LinearSystemSolver.mixed_precision_solve(matrix)
+            status = "" if result.converged else ", sin converger"
+            resultContainer.addElementAtEnd(
+                f"\nSolución (precision mixta - LU float32 + {result.iterations} pasos de refinamiento float64{status}, "
+                f"residuo relativo {result.final_residual():.3e}):"
+            )
+            for i in range(result.solution.getListLength()):
+                resultContainer.addElementAtEnd(f"x{i} = {result.solution.getElementAtIndex(i):.6f}")
+        except (SingularMatrixError, MatrixDimensionsError) as e:
+            ErrorLogger.log("MixedPrecisionError", f"Error en precision mixta: {str(e)}")
+            resultContainer.addElementAtEnd(f"Error en precision mixta: {str(e)}")
+
+    def performIterativeSolve(self, matrix: Matrix, resultContainer: LinkedList):
+        method = LinearSystemSolver.choose_iterative_method(matrix)
+        if method is None:
+            return
+        
+        try:
+            result = LinearSystemSolver.iterative_solve(matrix, method)
+            resultContainer.addElementAtEnd(f"\nSolución (iterativo - {result}):")
+            for i in range(result.solution.getListLength()):
+                resultContainer.addElementAtEnd(f"x{i} = {result.solution.getElementAtIndex(i):.6f}")
+        except (SingularMatrixError, MatrixDimensionsError, NonPositiveDefiniteError) as e:
+            ErrorLogger.log("IterativeSolverError", f"Error metodo iterativo ({method}): {str(e)}")
+            resultContainer.addElementAtEnd(f"Error en metodo iterativo ({method}): {str(e)}")
+
+    def performSparseSolve(self, sparse_matrix: SparseMatrix, resultContainer: LinkedList):
+        try:
+            solution_sparse = LinearSystemSolver.sparse_gaussian_elimination(sparse_matrix)
+            resultContainer.addElementAtEnd(f"\nSolución (Elim. dispersa - {sparse_matrix}):")
+            for i in range(solution_sparse.getListLength()):
+                resultContainer.addElementAtEnd(f"x{i} = {solution_sparse.getElementAtIndex(i):.6f}")
+        except (SingularMatrixError, MatrixDimensionsError) as e:
+            ErrorLogger.log("SparseElimError", f"Error Elim. dispersa: {str(e)}")
+            resultContainer.addElementAtEnd(f"Error en Elim. dispersa: {str(e)}")
+
     def displayProcessingStatistics(self, startTime: float, outputPath: str):
         processingDuration = time.time() - startTime
         print(f"Archivo procesado en: {processingDuration:.4f} segundos")
@@ -283,8 +484,6 @@ class LogicaPrincipal:
         
         if not self.fileProcessor.getErrorLog().isEmpty():
             print("\nErrores encontrados durante procesamiento:")
-            errorNode = self.fileProcessor.getErrorLog().headNode
-            while errorNode:
-                print(f"  - {errorNode.elementData}")
-                errorNode = errorNode.nextNode
+            for errorEntry in self.fileProcessor.getErrorLog():
+                print(f"  - {errorEntry}")
 
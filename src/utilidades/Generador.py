@@ -1,7 +1,9 @@
 import os
 import random
+from itertools import chain
 from datetime import datetime
 from estructuras.listaEnlazada import LinkedList
+from estructuras.canal import Channel
 
 class FileGenerator:
     def __init__(self, outputDirectory: str):
@@ -30,6 +32,23 @@ class FileGenerator:
             print(f"Error generando archivo: {str(error)}")
             return None
     
+    def generateOutputFileFromChannel(self, baseName: str, resultsChannel: Channel) -> str:
+        if not baseName:
+            raise ValueError("Datos insuficientes para generar archivo")
+        
+        try:
+            pendingLines = iter(resultsChannel)
+            firstLine = next(pendingLines, None)
+            if firstLine is None:
+                return None
+            
+            fileName = self.generateFileName(baseName)
+            fullPath = os.path.join(self.outputDirectory, fileName)
+            self.writeResultsToFile(fullPath, chain([firstLine], pendingLines))
+            return fullPath
+        finally:
+            resultsChannel.closeChannel()
+    
     def generateFileName(self, baseName: str) -> str:
         currentDate = datetime.now().strftime("%Y%m%d")
         serialNumber = random.randint(1, 999)
@@ -38,9 +57,7 @@ class FileGenerator:
     def writeResultsToFile(self, filePath: str, resultsList: LinkedList):
         try:
             with open(filePath, 'w', encoding='utf-8') as outputFile:
-                currentNode = resultsList.headNode
-                while currentNode:
-                    outputFile.write(currentNode.elementData + "\n")
-                    currentNode = currentNode.nextNode
+                for resultLine in resultsList:
+                    outputFile.write(resultLine + "\n")
         except IOError as ioError:
             raise IOError(f"Error escribiendo archivo: {str(ioError)}")
\ No newline at end of file